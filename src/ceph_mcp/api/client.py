@@ -1,16 +1,19 @@
 """Main client that combines all endpoint clients."""
 
-import httpx
+import asyncio
 
-from ceph_mcp.api.base import CephTokenManager
+import structlog
+
+from ceph_mcp.api.base import get_shared_httpx_client, get_shared_token_manager
 from ceph_mcp.api.endpoints.cephfs import CephFSClient
 from ceph_mcp.api.endpoints.daemon import DaemonClient
 from ceph_mcp.api.endpoints.health import HealthClient
 from ceph_mcp.api.endpoints.host import HostClient
 from ceph_mcp.api.endpoints.osd import OSDClient
 from ceph_mcp.api.endpoints.pool import PoolClient
-from ceph_mcp.config.settings import get_ssl_context, settings
+from ceph_mcp.config.settings import settings
 from ceph_mcp.models.cephfs import CephFSDetails, CephFSSummary
+from ceph_mcp.models.cluster import ClusterOverview
 from ceph_mcp.models.daemon import Daemon, DaemonSummary, DaemonTypeInfo
 from ceph_mcp.models.health import ClusterHealth
 from ceph_mcp.models.host import Host, HostSummary
@@ -28,6 +31,7 @@ class CephClient:
     """
 
     def __init__(self) -> None:
+        self.logger = structlog.get_logger(__name__)
         # Shared resources
         self._shared_session = None
         self._shared_token_manager = None
@@ -41,48 +45,56 @@ class CephClient:
         self.pool: PoolClient = PoolClient()
         self.cephfs: CephFSClient = CephFSClient()
 
-    async def __aenter__(self):
-        """Initialize all endpoint clients with shared session and token manager."""
-        # Create shared session once
-        self._shared_session = httpx.AsyncClient(
-            timeout=settings.request_timeout_seconds,
-            verify=get_ssl_context(),
-            limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
-        )
-
-        # Create shared token manager and authenticate once
-        self._shared_token_manager = CephTokenManager(
-            self._shared_session, self.base_url
-        )
-        await self._shared_token_manager.get_token()
-
-        # Inject shared resources into all endpoint clients
-        for client in [
+        self._clients = [
             self.health,
             self.host,
             self.daemon,
             self.osd,
             self.pool,
             self.cephfs,
-        ]:
+        ]
+
+    async def __aenter__(self):
+        """Initialize all endpoint clients with shared session and token manager."""
+        # Reuse the process-wide session so keep-alive connections survive
+        # across CephClient entries
+        self._shared_session = get_shared_httpx_client()
+
+        # Reuse the process-wide token manager so the cached JWT survives
+        # across CephClient instances; the first request authenticates lazily.
+        self._shared_token_manager = await get_shared_token_manager(
+            self._shared_session, self.base_url, settings.ceph_username
+        )
+
+        # Inject shared resources into all endpoint clients
+        for client in self._clients:
             client.session = self._shared_session
             client.token_manager = self._shared_token_manager
 
+        # Enter all endpoint clients concurrently so any per-client setup
+        # cost is paid once in wall-clock time, not once per client
+        await asyncio.gather(*(client.__aenter__() for client in self._clients))
+
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Clean up all endpoint clients."""
-        if self._shared_session:
-            await self._shared_session.aclose()
+        # The shared session stays open for the process lifetime; it is
+        # closed via aclose_shared_httpx_client() on server shutdown.
+        self._shared_session = None
+
+        # Exit all endpoint clients concurrently; one failing exit must not
+        # prevent the others from cleaning up
+        await asyncio.gather(
+            *(
+                client.__aexit__(exc_type, exc_val, exc_tb)
+                for client in self._clients
+            ),
+            return_exceptions=True,
+        )
+
         # Reset references
-        for client in [
-            self.health,
-            self.host,
-            self.daemon,
-            self.osd,
-            self.pool,
-            self.cephfs,
-        ]:
+        for client in self._clients:
             client.session = None
             client.token_manager = None
 
@@ -190,3 +202,39 @@ class CephClient:
             raise RuntimeError("Client not properly initialized")
 
         return await self.cephfs.get_fs_details(fs_id)
+
+    async def get_cluster_overview(self) -> ClusterOverview:
+        """
+        Get an aggregated overview of the whole cluster in one call.
+
+        All six domain summaries are fetched concurrently over the shared
+        connection pool. A failure in one domain is recorded per component
+        instead of failing the whole aggregate.
+        """
+        components = [
+            ("health", self.get_cluster_health()),
+            ("hosts", self.get_host_summary()),
+            ("daemons", self.get_daemon_summary()),
+            ("osds", self.get_osd_summary()),
+            ("pools", self.get_pool_summary()),
+            ("filesystems", self.get_fs_summary()),
+        ]
+
+        results = await asyncio.gather(
+            *(coro for _, coro in components), return_exceptions=True
+        )
+
+        overview_fields: dict = {}
+        errors: dict[str, str] = {}
+        for (component, _), result in zip(components, results):
+            if isinstance(result, BaseException):
+                self.logger.error(
+                    "Failed to fetch cluster overview component",
+                    component=component,
+                    error=str(result),
+                )
+                errors[component] = str(result)
+            else:
+                overview_fields[component] = result
+
+        return ClusterOverview(**overview_fields, errors=errors)
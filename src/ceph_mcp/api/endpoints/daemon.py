@@ -1,8 +1,7 @@
 """Daemon-related API endpoints."""
 
-from collections import defaultdict
-
-from ceph_mcp.api.base import BaseCephClient, CephAPIError
+from ceph_mcp.api.base import BaseCephClient, CephAPIError, TTLCache
+from ceph_mcp.config.settings import settings
 from ceph_mcp.models.daemon import (
     Daemon,
     DaemonSummary,
@@ -10,53 +9,90 @@ from ceph_mcp.models.daemon import (
     DaemonTypeSummary,
 )
 
+# Accept headers for the Ceph API versions this client targets
+ACCEPT_V0_1 = "application/vnd.ceph.api.v0.1+json"
+ACCEPT_V1_0 = "application/vnd.ceph.api.v1.0+json"
+
+
+# Actions accepted by the manager; frozen at module scope so each
+# call does a hashed membership test with no per-call allocation
+_VALID_DAEMON_ACTIONS = frozenset({"start", "stop", "restart"})
+_VALID_DAEMON_ACTIONS_STR = "start, stop, restart"
+
 
 class DaemonClient(BaseCephClient):  # pylint: disable=too-few-public-methods
     """Client for Ceph daemon-related operations."""
 
+    __slots__ = ("_summary_cache",)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._summary_cache = TTLCache()
+
     async def get_daemon_summary(self) -> DaemonSummary:
-        """Retrieve summary information about all daemons in the cluster."""
+        """
+        Retrieve summary information about all daemons in the cluster.
+
+        Served from a short-TTL cache so derived lookups (details, names
+        by type) within the window share one fetch and one parse.
+        """
+        return await self._summary_cache.get_or_create(
+            self._fetch_daemon_summary,
+            settings.cache_ttl_seconds,
+            settings.cache_stale_ttl_seconds,
+        )
+
+    async def _fetch_daemon_summary(self) -> DaemonSummary:
+        """Fetch and aggregate the daemon summary from the manager."""
         try:
-            response_data = await self._make_request(
-                "/api/daemon",
-                accept_header="application/vnd.ceph.api.v1.0+json",
-            )
+            daemons_data = await self._get_raw_daemons()
 
-            # Response should be a list of daemon objects
-            daemons_data = response_data if isinstance(response_data, list) else []
+            # Single pass: parse each daemon once, call is_running() once,
+            # and feed the overall tally and the per-type aggregate from
+            # the same result
+            # Pre-size the result list and assign by index - cheaper than
+            # growing it append-by-append for thousands of daemons
+            daemons = [None] * len(daemons_data)
+            running_daemons = 0
+            # Per daemon type: [daemon names, running count]. A plain dict
+            # with an explicit miss branch avoids defaultdict.__missing__
+            # overhead on every hit
+            type_agg: dict[str, list] = {}
 
-            daemons = []
-            for daemon_data in daemons_data:
-                daemons.append(self._parse_daemon_data(daemon_data))
+            # Bind hot lookups once; attribute resolution inside a loop over
+            # thousands of daemons is measurable interpreter overhead
+            parse = self._parse_daemon_data
 
-            # Calculate summary statistics
-            total_daemons = len(daemons)
-            running_daemons = len([daemon for daemon in daemons if daemon.is_running()])
-            stopped_daemons = total_daemons - running_daemons
+            for i, daemon_data in enumerate(daemons_data):
+                daemon = parse(daemon_data)
+                daemons[i] = daemon
 
-            # Group by daemon type
-            daemon_types = {}
-            type_groups = defaultdict(list)
+                running = daemon.is_running()
+                running_daemons += running
 
-            for daemon in daemons:
-                type_groups[daemon.daemon_type].append(daemon)
+                agg = type_agg.get(daemon.daemon_type)
+                if agg is None:
+                    agg = type_agg[daemon.daemon_type] = [[], 0]
+                agg[0].append(daemon.daemon_name)
+                agg[1] += running
 
-            for daemon_type, type_daemons in type_groups.items():
-                running_count = len([d for d in type_daemons if d.is_running()])
-                stopped_count = len(type_daemons) - running_count
+            total_daemons = len(daemons)
 
-                daemon_types[daemon_type] = DaemonTypeSummary(
+            daemon_types = {
+                daemon_type: DaemonTypeSummary(
                     daemon_type=daemon_type,
-                    total_count=len(type_daemons),
+                    total_count=len(daemon_names),
                     running_count=running_count,
-                    stopped_count=stopped_count,
-                    daemon_names=[d.daemon_name for d in type_daemons],
+                    stopped_count=len(daemon_names) - running_count,
+                    daemon_names=daemon_names,
                 )
+                for daemon_type, (daemon_names, running_count) in type_agg.items()
+            }
 
             return DaemonSummary(
                 total_daemons=total_daemons,
                 running_daemons=running_daemons,
-                stopped_daemons=stopped_daemons,
+                stopped_daemons=total_daemons - running_daemons,
                 daemon_types=daemon_types,
                 daemons=daemons,
             )
@@ -65,32 +101,54 @@ class DaemonClient(BaseCephClient):  # pylint: disable=too-few-public-methods
             self.logger.error("Failed to retrieve daemon summary", error=str(e))
             raise CephAPIError(f"Failed to get daemon summary: {str(e)}") from e
 
+    async def _get_raw_daemons(self) -> list[dict]:
+        """
+        Fetch the raw daemon list without building summary models.
+
+        Fast path for filtered lookups: parsing and aggregating every
+        daemon just to read one entry is wasted work on large clusters.
+        """
+        response_data = await self._make_request(
+            "/api/daemon",
+            accept_header=ACCEPT_V1_0,
+            cache_ttl=settings.cache_ttl_seconds,
+        )
+        return response_data if isinstance(response_data, list) else []
+
     async def get_daemon_names_by_type(self, daemon_type: str) -> DaemonTypeInfo:
         """Retrieve information about all daemons of a specific type."""
         try:
-            # Get all daemons first
-            daemon_summary = await self.get_daemon_summary()
+            raw_daemons = await self._get_raw_daemons()
 
-            # Filter by daemon type
-            type_daemons = daemon_summary.get_daemons_by_type(daemon_type)
+            # Single scan over the raw dicts - only matching daemons are
+            # inspected further, nothing is parsed into models
+            daemon_names: list[str] = []
+            running_count = 0
+            available_types: set[str] = set()
+            for raw in raw_daemons:
+                raw_type = raw.get("daemon_type", "unknown")
+                available_types.add(raw_type)
+                if raw_type != daemon_type:
+                    continue
+                daemon_names.append(raw.get("daemon_name", ""))
+                # Mirrors Daemon.is_running() on the raw dict
+                if (
+                    raw.get("status", 0) == 1
+                    or str(raw.get("status_desc", "")).lower() == "running"
+                ):
+                    running_count += 1
 
-            if not type_daemons:
-                # Check if the daemon type exists at all
-                available_types = daemon_summary.get_daemon_types()
-                if daemon_type not in available_types:
-                    raise CephAPIError(
-                        f"Daemon type '{daemon_type}' not found. Available types: {', '.join(available_types)}"
-                    )
-
-            running_count = len([d for d in type_daemons if d.is_running()])
-            stopped_count = len(type_daemons) - running_count
+            if not daemon_names and daemon_type not in available_types:
+                raise CephAPIError(
+                    f"Daemon type '{daemon_type}' not found. Available types: {', '.join(available_types)}"
+                )
 
             return DaemonTypeInfo(
                 daemon_type=daemon_type,
-                daemon_names=[daemon.daemon_name for daemon in type_daemons],
-                total_count=len(type_daemons),
+                daemon_names=daemon_names,
+                total_count=len(daemon_names),
                 running_count=running_count,
-                stopped_count=stopped_count,
+                stopped_count=len(daemon_names) - running_count,
             )
 
         except CephAPIError:
@@ -109,17 +167,19 @@ class DaemonClient(BaseCephClient):  # pylint: disable=too-few-public-methods
     async def get_daemon_details(self, hostname: str, daemon_name: str) -> Daemon:
         """Retrieve detailed information about a specific daemon."""
         try:
-            # Get all daemons first (since there's no single daemon endpoint)
-            daemon_summary = await self.get_daemon_summary()
-
-            # Find the specific daemon
-            daemon = daemon_summary.get_daemon_by_name_and_host(daemon_name, hostname)
-            if not daemon:
-                raise CephAPIError(
-                    f"Daemon '{daemon_name}' not found on host '{hostname}'"
-                )
+            # There is no single-daemon endpoint, so scan the raw list and
+            # parse only the matching entry
+            raw_daemons = await self._get_raw_daemons()
+            for raw in raw_daemons:
+                if (
+                    raw.get("daemon_name") == daemon_name
+                    and raw.get("hostname") == hostname
+                ):
+                    return self._parse_daemon_data(raw)
 
-            return daemon
+            raise CephAPIError(
+                f"Daemon '{daemon_name}' not found on host '{hostname}'"
+            )
 
         except CephAPIError:
             # Re-raise CephAPIError as-is
@@ -135,14 +195,41 @@ class DaemonClient(BaseCephClient):  # pylint: disable=too-few-public-methods
                 f"Failed to get daemon details for '{daemon_name}' on '{hostname}': {str(e)}"
             ) from e
 
+    async def get_daemons_details(
+        self, daemon_keys: list[tuple[str, str]]
+    ) -> list[Daemon]:
+        """
+        Retrieve details for several daemons with a single summary fetch.
+
+        daemon_keys is a list of (hostname, daemon_name) pairs. Callers
+        needing K daemons should use this instead of calling
+        get_daemon_details in a loop, which would re-fetch the daemon list
+        K times.
+        """
+        try:
+            daemon_summary = await self.get_daemon_summary()
+            wanted = set(daemon_keys)
+            return [
+                daemon
+                for daemon in daemon_summary.daemons
+                if (daemon.hostname, daemon.daemon_name) in wanted
+            ]
+
+        except Exception as e:
+            self.logger.error(
+                "Failed to retrieve daemons details",
+                daemon_keys=daemon_keys,
+                error=str(e),
+            )
+            raise CephAPIError(f"Failed to get daemons details: {str(e)}") from e
+
     async def perform_daemon_action(self, daemon_name: str, action: str) -> dict:
         """Perform an action on a specific daemon."""
         try:
             # Validate action
-            valid_actions = ["start", "stop", "restart"]
-            if action not in valid_actions:
+            if action not in _VALID_DAEMON_ACTIONS:
                 raise CephAPIError(
-                    f"Invalid action '{action}'. Valid actions: {', '.join(valid_actions)}"
+                    f"Invalid action '{action}'. Valid actions: {_VALID_DAEMON_ACTIONS_STR}"
                 )
 
             # Prepare request payload
@@ -150,11 +237,16 @@ class DaemonClient(BaseCephClient):  # pylint: disable=too-few-public-methods
 
             response_data = await self._make_request(
                 f"/api/daemon/{daemon_name}",
-                accept_header="application/vnd.ceph.api.v0.1+json",
+                accept_header=ACCEPT_V0_1,
                 method="PUT",
                 json_data=action_payload,
+                idempotent=False,
             )
 
+            # Daemon state changed - do not serve stale daemon summaries
+            self.invalidate_response_cache("GET /api/daemon")
+            self._summary_cache.clear()
+
             return {
                 "daemon_name": daemon_name,
                 "action": action,
@@ -178,20 +270,27 @@ class DaemonClient(BaseCephClient):  # pylint: disable=too-few-public-methods
 
     def _parse_daemon_data(self, daemon_data: dict) -> Daemon:
         """Convert raw daemon data to Daemon model."""
+        # Called once per daemon in tight loops; bind the bound method
+        # to a local instead of resolving daemon_data.get twelve times
+        get = daemon_data.get
         try:
-            return Daemon(
-                daemon_type=daemon_data.get("daemon_type", "unknown"),
-                daemon_id=daemon_data.get("daemon_id", ""),
-                daemon_name=daemon_data.get("daemon_name", ""),
-                hostname=daemon_data.get("hostname", ""),
-                memory_usage=daemon_data.get("memory_usage", 0),
-                memory_request=daemon_data.get("memory_request", 0),
-                cpu_percentage=daemon_data.get("cpu_percentage", "0%"),
-                version=daemon_data.get("version", ""),
-                status=daemon_data.get("status", 0),
-                status_desc=daemon_data.get("status_desc", ""),
-                systemd_unit=daemon_data.get("systemd_unit", ""),
-                started=daemon_data.get("started", ""),
+            # The manager's payload is trusted and every field is already
+            # defaulted via .get(), so skip Pydantic validation on the
+            # happy path; the except-fallback still uses the validating
+            # constructor for malformed entries
+            return Daemon.model_construct(
+                daemon_type=get("daemon_type", "unknown"),
+                daemon_id=get("daemon_id", ""),
+                daemon_name=get("daemon_name", ""),
+                hostname=get("hostname", ""),
+                memory_usage=get("memory_usage", 0),
+                memory_request=get("memory_request", 0),
+                cpu_percentage=get("cpu_percentage", "0%"),
+                version=get("version", ""),
+                status=get("status", 0),
+                status_desc=get("status_desc", ""),
+                systemd_unit=get("systemd_unit", ""),
+                started=get("started", ""),
             )
 
         except Exception as e:  # pylint: disable=broad-except
@@ -200,8 +299,8 @@ class DaemonClient(BaseCephClient):  # pylint: disable=too-few-public-methods
             )
             # Return a minimal daemon object with whatever we can extract
             return Daemon(
-                daemon_type=daemon_data.get("daemon_type", "unknown"),
-                daemon_id=daemon_data.get("daemon_id", ""),
-                daemon_name=daemon_data.get("daemon_name", "unknown"),
-                hostname=daemon_data.get("hostname", ""),
+                daemon_type=get("daemon_type", "unknown"),
+                daemon_id=get("daemon_id", ""),
+                daemon_name=get("daemon_name", "unknown"),
+                hostname=get("hostname", ""),
             )
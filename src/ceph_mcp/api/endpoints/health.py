@@ -1,6 +1,9 @@
 """Health-related API endpoints."""
 
-from ceph_mcp.api.base import BaseCephClient, CephAPIError
+import asyncio
+
+from ceph_mcp.api.base import BaseCephClient, CephAPIError, TTLCache
+from ceph_mcp.config.settings import settings
 from ceph_mcp.models.health import (
     ClusterCapacity,
     ClusterHealth,
@@ -9,21 +12,54 @@ from ceph_mcp.models.health import (
     HealthStatus,
 )
 
+# Accept header for the Ceph API version this client targets
+ACCEPT_V1_0 = "application/vnd.ceph.api.v1.0+json"
+
+# Memoized severity lookup - the enum constructor does a linear member
+# scan per call, a dict hit does not
+_SEVERITY_MAP = {severity.value: severity for severity in HealthCheckSeverity}
+
 
 class HealthClient(BaseCephClient):  # pylint: disable=too-few-public-methods
     """Client for Ceph health-related operations."""
 
+    __slots__ = ("_health_cache", "_capacity_cache")
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._health_cache = TTLCache()
+        self._capacity_cache = TTLCache()
+
     async def get_cluster_health(self) -> ClusterHealth:
-        """Retrieve the overall health status of the Ceph cluster."""
-        try:
-            response_data = await self._make_request(
-                "/api/health/minimal",
-                accept_header="application/vnd.ceph.api.v1.0+json",
-            )
+        """
+        Retrieve the overall health status of the Ceph cluster.
 
-            cluster_fsid = await self._make_request(
-                "/api/health/get_cluster_fsid",
-                accept_header="application/vnd.ceph.api.v1.0+json",
+        Served from a short-TTL cache with request coalescing, so
+        back-to-back health queries (summary, details, recommendations)
+        share one fetch and one parse.
+        """
+        return await self._health_cache.get_or_create(
+            self._fetch_cluster_health,
+            settings.cache_ttl_seconds,
+            settings.cache_stale_ttl_seconds,
+        )
+
+    async def _fetch_cluster_health(self) -> ClusterHealth:
+        """Fetch and assemble the cluster health from the manager."""
+        try:
+            # The two requests are independent, so overlap their round-trips
+            # instead of paying the manager latency twice
+            response_data, cluster_fsid = await asyncio.gather(
+                self._make_request(
+                    "/api/health/minimal",
+                    accept_header=ACCEPT_V1_0,
+                    cache_ttl=settings.cache_ttl_seconds,
+                ),
+                self._make_request(
+                    "/api/health/get_cluster_fsid",
+                    accept_header=ACCEPT_V1_0,
+                    cache_ttl=settings.cache_ttl_seconds,
+                ),
             )
 
             health_data = response_data.get("health", {})
@@ -59,13 +95,13 @@ class HealthClient(BaseCephClient):  # pylint: disable=too-few-public-methods
         if status == HealthStatus.OK:
             return "Cluster is operating normally with no issues detected."
         if status == HealthStatus.WARN:
-            # Loop HealthCheck objects to find warnings count
-            warnings = [check for check in checks if check.is_warning()]
-            return f"Cluster has {len(warnings)} warnings that should be investigated."
+            # Count warnings without materializing a throwaway list
+            warnings = sum(1 for check in checks if check.is_warning())
+            return f"Cluster has {warnings} warnings that should be investigated."
         if status == HealthStatus.ERR:
-            # Loop HealthCheck objects to find errors count
-            errors = [check for check in checks if check.is_critical()]
-            return f"Cluster has {len(errors)} errors requiring immediate attention."
+            # Count errors without materializing a throwaway list
+            errors = sum(1 for check in checks if check.is_critical())
+            return f"Cluster has {errors} errors requiring immediate attention."
 
         return "Cluster health status is unknown or unrecognized."
 
@@ -73,16 +109,23 @@ class HealthClient(BaseCephClient):  # pylint: disable=too-few-public-methods
         """Convert raw health checks to HealthCheck models."""
         health_checks = []
         for check in checks:
-            detail_messages = []
-            for detail in check.get("detail", []):
-                detail_messages.append(detail.get("message", ""))
+            raw_severity = check.get("severity", "unknown")
+            severity = _SEVERITY_MAP.get(raw_severity)
+            if severity is None:
+                # Unknown severities still raise through the enum, matching
+                # the previous behavior
+                severity = HealthCheckSeverity(raw_severity)
+            summary = check.get("summary", {})
             health_checks.append(
                 HealthCheck(
                     type=check.get("type", "unknown"),
-                    severity=HealthCheckSeverity(check.get("severity", "unknown")),
-                    summary=check.get("summary", {}).get("message", ""),
-                    details=", ".join(detail_messages),
-                    count=check.get("summary", {}).get("count", 0),
+                    severity=severity,
+                    summary=summary.get("message", ""),
+                    details=", ".join(
+                        detail.get("message", "")
+                        for detail in check.get("detail", [])
+                    ),
+                    count=summary.get("count", 0),
                 )
             )
         return health_checks
@@ -91,18 +134,29 @@ class HealthClient(BaseCephClient):  # pylint: disable=too-few-public-methods
         """
         Get cluster capacity summary.
 
+        Served from a short-TTL cache with request coalescing, like
+        get_cluster_health.
+
         Returns:
             ClusterCapacity: Cluster capacity information
 
         Raises:
             CephAPIError: If the API request fails
         """
+        return await self._capacity_cache.get_or_create(
+            self._fetch_cluster_capacity,
+            settings.cache_ttl_seconds,
+            settings.cache_stale_ttl_seconds,
+        )
+
+    async def _fetch_cluster_capacity(self) -> ClusterCapacity:
+        """Fetch the cluster capacity from the manager."""
         self.logger.debug("Fetching cluster capacity summary")
 
         try:
             capacity_data = await self._make_request(
                 "/api/health/get_cluster_capacity",
-                accept_header="application/vnd.ceph.api.v1.0+json",
+                accept_header=ACCEPT_V1_0,
             )
 
             self.logger.debug(
@@ -1,30 +1,48 @@
 """Host-related API endpoints."""
 
-from ceph_mcp.api.base import BaseCephClient, CephAPIError
+from ceph_mcp.api.base import BaseCephClient, CephAPIError, TTLCache
+from ceph_mcp.config.settings import settings
 from ceph_mcp.models.host import Host, HostSummary, ServiceInstance
 
+# Accept header for the Ceph API version this client targets
+ACCEPT_V1_3 = "application/vnd.ceph.api.v1.3+json"
+
 
 class HostClient(BaseCephClient):  # pylint: disable=too-few-public-methods
     """Client for Ceph host-related operations."""
 
+    __slots__ = ("_summary_cache",)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._summary_cache = TTLCache()
+
     async def get_host_summary(self) -> HostSummary:
-        """Retrieve summary information about all hosts in the cluster."""
+        """
+        Retrieve summary information about all hosts in the cluster.
+
+        Served from a short-TTL cache so derived lookups (host details)
+        within the window share one fetch and one parse.
+        """
+        return await self._summary_cache.get_or_create(
+            self._fetch_host_summary,
+            settings.cache_ttl_seconds,
+            settings.cache_stale_ttl_seconds,
+        )
+
+    async def _fetch_host_summary(self) -> HostSummary:
+        """Fetch and aggregate the host summary from the manager."""
         try:
-            response_data = await self._make_request(
-                "/api/host?facts=true",
-                accept_header="application/vnd.ceph.api.v1.3+json",
-            )
-
-            # Response should be a list of host objects
-            hosts_data = response_data if isinstance(response_data, list) else []
+            hosts_data = await self._get_raw_hosts()
 
-            hosts = []
-            for host_data in hosts_data:
-                hosts.append(self._parse_host_data(host_data))
+            # Bind hot lookups once; attribute resolution inside the parse
+            # loop is measurable interpreter overhead on large clusters
+            parse = self._parse_host_data
+            hosts = [parse(host_data) for host_data in hosts_data]
 
             # Calculate summary statistics
             total_hosts = len(hosts)
-            online_hosts = len([host for host in hosts if host.is_online()])
+            online_hosts = sum(1 for host in hosts if host.is_online())
             offline_hosts = total_hosts - online_hosts
 
             return HostSummary(
@@ -38,18 +56,31 @@ class HostClient(BaseCephClient):  # pylint: disable=too-few-public-methods
             self.logger.error("Failed to retrieve host summary", error=str(e))
             raise CephAPIError(f"Failed to get host summary: {str(e)}") from e
 
+    async def _get_raw_hosts(self) -> list[dict]:
+        """
+        Fetch the raw host list without building summary models.
+
+        Fast path for filtered lookups: parsing every host just to read
+        one entry is wasted work on large clusters.
+        """
+        response_data = await self._make_request(
+            "/api/host?facts=true",
+            accept_header=ACCEPT_V1_3,
+            cache_ttl=settings.cache_ttl_seconds,
+        )
+        return response_data if isinstance(response_data, list) else []
+
     async def get_host_details(self, hostname: str) -> Host:
         """Retrieve detailed information about a specific host."""
         try:
-            # Get all hosts first (since there's no single host endpoint)
-            host_summary = await self.get_host_summary()
+            # There is no single-host endpoint, so scan the raw list and
+            # parse only the matching entry
+            raw_hosts = await self._get_raw_hosts()
+            for raw in raw_hosts:
+                if raw.get("hostname") == hostname:
+                    return self._parse_host_data(raw)
 
-            # Find the specific host
-            host = host_summary.get_host_by_hostname(hostname)
-            if not host:
-                raise CephAPIError(f"Host '{hostname}' not found in cluster")
-
-            return host
+            raise CephAPIError(f"Host '{hostname}' not found in cluster")
 
         except CephAPIError:
             # Re-raise CephAPIError as-is
@@ -62,39 +93,63 @@ class HostClient(BaseCephClient):  # pylint: disable=too-few-public-methods
                 f"Failed to get host details for '{hostname}': {str(e)}"
             ) from e
 
+    async def get_hosts_details(self, hostnames: list[str]) -> list[Host]:
+        """
+        Retrieve details for several hosts with a single summary fetch.
+
+        Callers needing K hosts should use this instead of calling
+        get_host_details in a loop, which would re-fetch the host list K
+        times.
+        """
+        try:
+            host_summary = await self.get_host_summary()
+            wanted = set(hostnames)
+            return [host for host in host_summary.hosts if host.hostname in wanted]
+
+        except Exception as e:
+            self.logger.error(
+                "Failed to retrieve hosts details", hostnames=hostnames, error=str(e)
+            )
+            raise CephAPIError(f"Failed to get hosts details: {str(e)}") from e
+
     def _parse_host_data(self, host_data: dict) -> Host:
         """Convert raw host data to Host model."""
+        # Called once per host in tight loops; bind the bound method to a
+        # local instead of resolving host_data.get twenty times
+        get = host_data.get
         try:
-            # Parse service instances
-            service_instances = []
-            for service_data in host_data.get("service_instances", []):
-                service_instances.append(
-                    ServiceInstance(
-                        type=service_data.get("type", "unknown"),
-                        count=service_data.get("count", 0),
-                    )
+            # The manager's payload is trusted and every field is already
+            # defaulted via .get(), so skip Pydantic validation on the
+            # happy path; the except-fallback still uses the validating
+            # constructor for malformed entries
+            service_instances = [
+                ServiceInstance.model_construct(
+                    type=service_data.get("type", "unknown"),
+                    count=service_data.get("count", 0),
                 )
-
-            return Host(
-                hostname=host_data.get("hostname", "unknown"),
-                addr=host_data.get("addr", ""),
-                status=host_data.get("status", ""),
-                labels=host_data.get("labels", []),
+                for service_data in get("service_instances", [])
+            ]
+
+            return Host.model_construct(
+                hostname=get("hostname", "unknown"),
+                addr=get("addr", ""),
+                status=get("status", ""),
+                labels=get("labels", []),
                 service_instances=service_instances,
-                arch=host_data.get("arch", ""),
-                cpu_cores=host_data.get("cpu_cores", 0),
-                cpu_count=host_data.get("cpu_count", 0),
-                cpu_threads=host_data.get("cpu_threads", 0),
-                cpu_model=host_data.get("cpu_model", ""),
-                memory_total_kb=host_data.get("memory_total_kb", 0),
-                memory_available_kb=host_data.get("memory_available_kb", 0),
-                memory_free_kb=host_data.get("memory_free_kb", 0),
-                operating_system=host_data.get("operating_system", ""),
-                kernel=host_data.get("kernel", ""),
-                fqdn=host_data.get("fqdn", ""),
-                shortname=host_data.get("shortname", ""),
-                system_uptime=host_data.get("system_uptime", 0.0),
-                timestamp=host_data.get("timestamp", 0.0),
+                arch=get("arch", ""),
+                cpu_cores=get("cpu_cores", 0),
+                cpu_count=get("cpu_count", 0),
+                cpu_threads=get("cpu_threads", 0),
+                cpu_model=get("cpu_model", ""),
+                memory_total_kb=get("memory_total_kb", 0),
+                memory_available_kb=get("memory_available_kb", 0),
+                memory_free_kb=get("memory_free_kb", 0),
+                operating_system=get("operating_system", ""),
+                kernel=get("kernel", ""),
+                fqdn=get("fqdn", ""),
+                shortname=get("shortname", ""),
+                system_uptime=get("system_uptime", 0.0),
+                timestamp=get("timestamp", 0.0),
             )
 
         except Exception as e:  # pylint: disable=broad-except
@@ -103,7 +158,7 @@ class HostClient(BaseCephClient):  # pylint: disable=too-few-public-methods
             )
             # Return a minimal host object with whatever we can extract
             return Host(
-                hostname=host_data.get("hostname", "unknown"),
-                addr=host_data.get("addr", ""),
-                status=host_data.get("status", ""),
+                hostname=get("hostname", "unknown"),
+                addr=get("addr", ""),
+                status=get("status", ""),
             )
@@ -1,8 +1,7 @@
 """OSD-related API endpoints."""
 
-from collections import defaultdict
-
-from ceph_mcp.api.base import BaseCephClient, CephAPIError
+from ceph_mcp.api.base import BaseCephClient, CephAPIError, TTLCache
+from ceph_mcp.config.settings import settings
 from ceph_mcp.models.osd import (
     OSD,
     DeviceClassSummary,
@@ -14,70 +13,110 @@ from ceph_mcp.models.osd import (
     Tree,
 )
 
+# Accept headers for the Ceph API versions this client targets
+ACCEPT_V1_0 = "application/vnd.ceph.api.v1.0+json"
+ACCEPT_V1_1 = "application/vnd.ceph.api.v1.1+json"
 
-class OSDClient(BaseCephClient):  # pylint: disable=too-few-public-methods
-    """Client for Ceph OSD-related operations."""
-
-    async def get_osd_summary(self) -> OSDSummary:
-        """Retrieve summary information about all OSDs in the cluster."""
-        try:
-            response_data = await self._make_request(
-                "/api/osd?limit=-1",
-                accept_header="application/vnd.ceph.api.v1.1+json",
-            )
-
-            # Response should be a list of OSD objects
-            osds_data = response_data if isinstance(response_data, list) else []
 
-            osds = []
-            for osd_data in osds_data:
-                osds.append(self._parse_osd_data(osd_data))
+# Actions accepted by the manager; frozen at module scope so each
+# call does a hashed membership test with no per-call allocation
+_VALID_MARK_ACTIONS = frozenset({"noout", "out", "in"})
+_VALID_MARK_ACTIONS_STR = "noout, out, in"
 
-            # Calculate summary statistics
-            total_osds = len(osds)
-            up_osds = len([osd for osd in osds if osd.is_up()])
-            down_osds = total_osds - up_osds
-            in_osds = len([osd for osd in osds if osd.is_in()])
-            out_osds = total_osds - in_osds
-            working_osds = len([osd for osd in osds if osd.is_working()])
 
-            # Get unique hosts
-            unique_hosts = list({osd.get_hostname() for osd in osds})
+class OSDClient(BaseCephClient):  # pylint: disable=too-few-public-methods
+    """Client for Ceph OSD-related operations."""
 
-            # Get unique device classes
-            device_classes = list({osd.get_device_class() for osd in osds})
+    __slots__ = ("_summary_cache",)
 
-            # Group by device class for summary
-            device_class_summary = {}
-            device_groups = defaultdict(list)
+    def __init__(self) -> None:
+        super().__init__()
+        self._summary_cache = TTLCache()
 
-            for osd in osds:
-                device_groups[osd.get_device_class()].append(osd)
+    async def get_osd_summary(self) -> OSDSummary:
+        """
+        Retrieve summary information about all OSDs in the cluster.
+
+        Served from a short-TTL cache so derived lookups (OSD IDs, OSD
+        details) within the window share one fetch and one parse.
+        """
+        return await self._summary_cache.get_or_create(
+            self._fetch_osd_summary,
+            settings.cache_ttl_seconds,
+            settings.cache_stale_ttl_seconds,
+        )
+
+    async def _fetch_osd_summary(self) -> OSDSummary:
+        """Fetch and aggregate the OSD summary from the manager."""
+        try:
+            osds_data = await self._get_raw_osds()
+
+            # Single traversal: parse each OSD once and update the status
+            # counters, host set, and per-device-class totals inline
+            # instead of re-walking the list for every statistic
+            parse = self._parse_osd_data
+            # Pre-size the result list and assign by index - cheaper than
+            # growing it append-by-append for thousands of OSDs
+            osds = [None] * len(osds_data)
+            up_osds = in_osds = working_osds = 0
+            hosts: set[str] = set()
+            # Per device class: [osd_count, pgs, kb, kb_used, kb_avail].
+            # A plain dict with an explicit miss branch avoids
+            # defaultdict.__missing__ overhead on every hit
+            class_totals: dict[str, list[int]] = {}
+
+            for i, osd_data in enumerate(osds_data):
+                osd = parse(osd_data)
+                osds[i] = osd
+
+                if osd.is_up():
+                    up_osds += 1
+                if osd.is_in():
+                    in_osds += 1
+                if osd.is_working():
+                    working_osds += 1
+                hosts.add(osd.get_hostname())
+
+                stats = osd.osd_stats
+                device_class = osd.get_device_class()
+                totals = class_totals.get(device_class)
+                if totals is None:
+                    totals = class_totals[device_class] = [0, 0, 0, 0, 0]
+                totals[0] += 1
+                totals[1] += stats.num_pgs
+                totals[2] += stats.kb
+                totals[3] += stats.kb_used
+                totals[4] += stats.kb_avail
 
-            for device_class, class_osds in device_groups.items():
-                total_pgs = sum(osd.osd_stats.num_pgs for osd in class_osds)
-                total_capacity = sum(osd.osd_stats.kb for osd in class_osds)
-                total_used = sum(osd.osd_stats.kb_used for osd in class_osds)
-                total_available = sum(osd.osd_stats.kb_avail for osd in class_osds)
+            total_osds = len(osds)
 
-                device_class_summary[device_class] = DeviceClassSummary(
+            device_class_summary = {
+                device_class: DeviceClassSummary(
                     device_class=device_class,
-                    osd_count=len(class_osds),
+                    osd_count=osd_count,
                     total_pgs=total_pgs,
                     total_capacity_kb=total_capacity,
                     total_used_kb=total_used,
                     total_available_kb=total_available,
                 )
+                for device_class, (
+                    osd_count,
+                    total_pgs,
+                    total_capacity,
+                    total_used,
+                    total_available,
+                ) in class_totals.items()
+            }
 
             return OSDSummary(
                 total_osds=total_osds,
                 up_osds=up_osds,
-                down_osds=down_osds,
+                down_osds=total_osds - up_osds,
                 in_osds=in_osds,
-                out_osds=out_osds,
+                out_osds=total_osds - in_osds,
                 working_osds=working_osds,
-                unique_hosts=unique_hosts,
-                device_classes=device_classes,
+                unique_hosts=list(hosts),
+                device_classes=list(class_totals),
                 device_class_summary=device_class_summary,
                 osds=osds,
             )
@@ -86,16 +125,32 @@ class OSDClient(BaseCephClient):  # pylint: disable=too-few-public-methods
             self.logger.error("Failed to retrieve OSD summary", error=str(e))
             raise CephAPIError(f"Failed to get OSD summary: {str(e)}") from e
 
+    async def _get_raw_osds(self) -> list[dict]:
+        """
+        Fetch the raw OSD list without building summary models.
+
+        Fast path for filtered lookups: parsing and aggregating every OSD
+        just to read one entry is wasted work on large clusters.
+        """
+        response_data = await self._make_request(
+            "/api/osd?limit=-1",
+            accept_header=ACCEPT_V1_1,
+            cache_ttl=settings.cache_ttl_seconds,
+        )
+        return response_data if isinstance(response_data, list) else []
+
     async def get_osd_ids(self) -> OSDIdInfo:
         """Retrieve list of all OSD IDs and their hosts."""
         try:
-            # Get all OSDs first
-            osd_summary = await self.get_osd_summary()
-
-            # Extract OSD ID and host information
+            # IDs and hostnames are read straight off the raw dicts -
+            # no OSD models are built for this view
+            raw_osds = await self._get_raw_osds()
             osd_ids = [
-                {"osd_id": osd.osd, "hostname": osd.get_hostname()}
-                for osd in osd_summary.osds
+                {
+                    "osd_id": raw.get("osd", 0),
+                    "hostname": raw.get("host", {}).get("name", "unknown"),
+                }
+                for raw in raw_osds
             ]
 
             return OSDIdInfo(osd_ids=osd_ids, total_count=len(osd_ids))
@@ -107,18 +162,17 @@ class OSDClient(BaseCephClient):  # pylint: disable=too-few-public-methods
     async def get_osd_details(self, osd_id: int) -> OSD:
         """Retrieve detailed information about a specific OSD."""
         try:
-            # Get all OSDs first (since there's no single OSD endpoint)
-            osd_summary = await self.get_osd_summary()
-
-            # Find the specific OSD
-            osd = osd_summary.get_osd_by_id(osd_id)
-            if not osd:
-                available_ids = [str(osd.osd) for osd in osd_summary.osds]
-                raise CephAPIError(
-                    f"OSD {osd_id} not found. Available OSD IDs: {', '.join(available_ids)}"
-                )
-
-            return osd
+            # There is no single-OSD endpoint, so scan the raw list and
+            # parse only the matching entry
+            raw_osds = await self._get_raw_osds()
+            for raw in raw_osds:
+                if raw.get("osd") == osd_id:
+                    return self._parse_osd_data(raw)
+
+            available_ids = [str(raw.get("osd", 0)) for raw in raw_osds]
+            raise CephAPIError(
+                f"OSD {osd_id} not found. Available OSD IDs: {', '.join(available_ids)}"
+            )
 
         except CephAPIError:
             # Re-raise CephAPIError as-is
@@ -131,6 +185,25 @@ class OSDClient(BaseCephClient):  # pylint: disable=too-few-public-methods
                 f"Failed to get OSD details for OSD {osd_id}: {str(e)}"
             ) from e
 
+    async def get_osds_details(self, osd_ids: list[int]) -> list[OSD]:
+        """
+        Retrieve details for several OSDs with a single summary fetch.
+
+        Callers needing K OSDs should use this instead of calling
+        get_osd_details in a loop, which would re-fetch the OSD list K
+        times.
+        """
+        try:
+            osd_summary = await self.get_osd_summary()
+            wanted = set(osd_ids)
+            return [osd for osd in osd_summary.osds if osd.osd in wanted]
+
+        except Exception as e:
+            self.logger.error(
+                "Failed to retrieve OSDs details", osd_ids=osd_ids, error=str(e)
+            )
+            raise CephAPIError(f"Failed to get OSDs details: {str(e)}") from e
+
     async def perform_osd_mark_action(self, osd_id: int, action: str) -> dict:
         """Perform a mark action on a specific OSD."""
         try:
@@ -141,10 +214,9 @@ class OSDClient(BaseCephClient):  # pylint: disable=too-few-public-methods
                 )
 
             # Validate action
-            valid_actions = ["noout", "out", "in"]
-            if action not in valid_actions:
+            if action not in _VALID_MARK_ACTIONS:
                 raise CephAPIError(
-                    f"Invalid action '{action}'. Valid actions: {', '.join(valid_actions)}"
+                    f"Invalid action '{action}'. Valid actions: {_VALID_MARK_ACTIONS_STR}"
                 )
 
             # Prepare request payload
@@ -152,11 +224,16 @@ class OSDClient(BaseCephClient):  # pylint: disable=too-few-public-methods
 
             response_data = await self._make_request(
                 f"/api/osd/{osd_id}/mark",
-                accept_header="application/vnd.ceph.api.v1.0+json",
+                accept_header=ACCEPT_V1_0,
                 method="PUT",
                 json_data=action_payload,
+                idempotent=False,
             )
 
+            # OSD state changed - do not serve stale OSD summaries
+            self.invalidate_response_cache("GET /api/osd")
+            self._summary_cache.clear()
+
             return {
                 "osd_id": osd_id,
                 "action": action,
@@ -180,48 +257,56 @@ class OSDClient(BaseCephClient):  # pylint: disable=too-few-public-methods
 
     def _parse_osd_data(self, osd_data: dict) -> OSD:
         """Convert raw OSD data to OSD model."""
+        # Called once per OSD in tight loops; bind the dict .get methods
+        # to locals instead of re-resolving them for every field
+        get = osd_data.get
         try:
             # Parse nested structures
-            osd_stats_data = osd_data.get("osd_stats", {})
-            tree_data = osd_data.get("tree", {})
-            host_data = osd_data.get("host", {})
-
-            # Parse performance statistics
-            perf_stat_data = osd_stats_data.get("perf_stat", {})
-            perf_stat = PerfStat(
+            osd_stats_data = get("osd_stats", {})
+            tree_data = get("tree", {})
+            host_data = get("host", {})
+            stats_get = osd_stats_data.get
+
+            # The manager's payload is trusted and every field is already
+            # defaulted via .get(), so skip Pydantic validation on the
+            # happy path; the except-fallback still uses the validating
+            # constructors for malformed entries
+            perf_stat_data = stats_get("perf_stat", {})
+            perf_stat = PerfStat.model_construct(
                 commit_latency_ms=perf_stat_data.get("commit_latency_ms", 0.0),
                 apply_latency_ms=perf_stat_data.get("apply_latency_ms", 0.0),
             )
 
             # Parse OSD statistics
-            osd_stats = OSDStats(
-                osd=osd_stats_data.get("osd", 0),
-                num_pgs=osd_stats_data.get("num_pgs", 0),
-                num_osds=osd_stats_data.get("num_osds", 1),
-                kb=osd_stats_data.get("kb", 0),
-                kb_used=osd_stats_data.get("kb_used", 0),
-                kb_avail=osd_stats_data.get("kb_avail", 0),
+            osd_stats = OSDStats.model_construct(
+                osd=stats_get("osd", 0),
+                num_pgs=stats_get("num_pgs", 0),
+                num_osds=stats_get("num_osds", 1),
+                kb=stats_get("kb", 0),
+                kb_used=stats_get("kb_used", 0),
+                kb_avail=stats_get("kb_avail", 0),
                 perf_stat=perf_stat,
-                alerts=osd_stats_data.get("alerts", []),
+                alerts=stats_get("alerts", []),
             )
 
             # Parse tree information
-            tree = Tree(
+            tree = Tree.model_construct(
                 id=tree_data.get("id", 0),
                 device_class=tree_data.get("device_class", ""),
                 type=tree_data.get("type", "osd"),
             )
 
             # Parse host information
-            host = Host(name=host_data.get("name", "unknown"))
-
-            return OSD(
-                osd=osd_data.get("osd", 0),
-                id=osd_data.get("id", 0),
-                up=osd_data.get("up", 0),
-                **{"in": osd_data.get("in", 0)},
-                weight=osd_data.get("weight", 1.0),
-                operational_status=osd_data.get("operational_status", ""),
+            host = Host.model_construct(name=host_data.get("name", "unknown"))
+
+            # model_construct takes the field name (in_), not the alias
+            return OSD.model_construct(
+                osd=get("osd", 0),
+                id=get("id", 0),
+                up=get("up", 0),
+                in_=get("in", 0),
+                weight=get("weight", 1.0),
+                operational_status=get("operational_status", ""),
                 osd_stats=osd_stats,
                 tree=tree,
                 host=host,
@@ -233,13 +318,13 @@ class OSDClient(BaseCephClient):  # pylint: disable=too-few-public-methods
             )
             # Return a minimal OSD object with whatever we can extract
             return OSD(
-                osd=osd_data.get("osd", 0),
-                id=osd_data.get("id", 0),
-                up=osd_data.get("up", 0),
-                **{"in": osd_data.get("in", 0)},
-                weight=osd_data.get("weight", 1.0),
-                operational_status=osd_data.get("operational_status", ""),
-                osd_stats=OSDStats(osd=osd_data.get("osd", 0)),
-                tree=Tree(id=osd_data.get("id", 0)),
+                osd=get("osd", 0),
+                id=get("id", 0),
+                up=get("up", 0),
+                **{"in": get("in", 0)},
+                weight=get("weight", 1.0),
+                operational_status=get("operational_status", ""),
+                osd_stats=OSDStats(osd=get("osd", 0)),
+                tree=Tree(id=get("id", 0)),
                 host=Host(name="unknown"),
             )
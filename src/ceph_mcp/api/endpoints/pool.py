@@ -1,8 +1,7 @@
 """Pool-related API endpoints."""
 
-from collections import defaultdict
-
-from ceph_mcp.api.base import BaseCephClient, CephAPIError
+from ceph_mcp.api.base import BaseCephClient, CephAPIError, TTLCache
+from ceph_mcp.config.settings import settings
 from ceph_mcp.models.pool import (
     Pool,
     PoolOptions,
@@ -11,70 +10,105 @@ from ceph_mcp.models.pool import (
     PoolTypeSummary,
 )
 
+# Accept header for the Ceph API version this client targets
+ACCEPT_V1_0 = "application/vnd.ceph.api.v1.0+json"
+
+# Shared .get() defaults for the trusted parse path below. These are
+# stored as-is by model_construct and must never be mutated; sharing them
+# avoids allocating a fresh empty list/dict per pool that lacks the key
+_EMPTY_METADATA: list[str] = []
+_EMPTY_PG_STATUS: dict[str, int] = {}
+
 
 class PoolClient(BaseCephClient):  # pylint: disable=too-few-public-methods
     """Client for Ceph pool-related operations."""
 
+    __slots__ = ("_summary_cache",)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._summary_cache = TTLCache()
+
     async def get_pool_summary(self) -> PoolSummary:
-        """Retrieve summary information about all pools in the cluster."""
+        """
+        Retrieve summary information about all pools in the cluster.
+
+        Served from a short-TTL cache so derived lookups (pool details)
+        within the window share one fetch and one parse.
+        """
+        return await self._summary_cache.get_or_create(
+            self._fetch_pool_summary,
+            settings.cache_ttl_seconds,
+            settings.cache_stale_ttl_seconds,
+        )
+
+    async def _fetch_pool_summary(self) -> PoolSummary:
+        """Fetch and aggregate the pool summary from the manager."""
         try:
             response_data = await self._make_request(
                 "/api/pool?stats=true",
-                accept_header="application/vnd.ceph.api.v1.0+json",
+                accept_header=ACCEPT_V1_0,
+                cache_ttl=settings.cache_ttl_seconds,
             )
 
             # Response should be a list of pool objects
             pools_data = response_data if isinstance(response_data, list) else []
 
-            pools = []
-            for pool_data in pools_data:
-                pools.append(self._parse_pool_data(pool_data))
+            # Single traversal: parse each pool once and update the type
+            # counters, per-type names, PG total and per-state totals
+            # inline instead of re-walking the list for every statistic
+            parse = self._parse_pool_data
+            pools = [None] * len(pools_data)
+            replicated_pools = erasure_pools = healthy_pools = total_pgs = 0
+            # Per pool type: list of pool names
+            type_names: dict[str, list[str]] = {}
+            # Per PG state: [pool_count, total_pgs]
+            pg_state_totals: dict[str, list[int]] = {}
+
+            for i, pool_data in enumerate(pools_data):
+                pool = parse(pool_data)
+                pools[i] = pool
+
+                if pool.is_replicated():
+                    replicated_pools += 1
+                if pool.is_erasure():
+                    erasure_pools += 1
+                if pool.is_healthy():
+                    healthy_pools += 1
+                total_pgs += pool.get_total_pgs()
+
+                names = type_names.get(pool.type)
+                if names is None:
+                    names = type_names[pool.type] = []
+                names.append(pool.pool_name)
+
+                pg_status = pool.pg_status
+                for state in pool.get_pg_states():
+                    entry = pg_state_totals.get(state)
+                    if entry is None:
+                        entry = pg_state_totals[state] = [0, 0]
+                    entry[0] += 1
+                    entry[1] += pg_status.get(state, 0)
 
-            # Calculate summary statistics
             total_pools = len(pools)
-            replicated_pools = len([pool for pool in pools if pool.is_replicated()])
-            erasure_pools = len([pool for pool in pools if pool.is_erasure()])
 
-            # Group by pool type
-            pool_types = {}
-            type_groups = defaultdict(list)
-
-            for pool in pools:
-                type_groups[pool.type].append(pool)
-
-            for pool_type, type_pools in type_groups.items():
-                pool_types[pool_type] = PoolTypeSummary(
+            pool_types = {
+                pool_type: PoolTypeSummary(
                     pool_type=pool_type,
-                    count=len(type_pools),
-                    pool_names=[p.pool_name for p in type_pools],
+                    count=len(names),
+                    pool_names=names,
                 )
+                for pool_type, names in type_names.items()
+            }
 
-            # Aggregate PG status across all pools
-            total_pgs = sum(pool.get_total_pgs() for pool in pools)
-            pg_state_aggregation = defaultdict(
-                lambda: {"pool_count": 0, "total_pgs": 0}
-            )
-
-            for pool in pools:
-                pool_states = pool.get_pg_states()
-                for state in pool_states:
-                    pg_state_aggregation[state]["pool_count"] += 1
-                    pg_state_aggregation[state]["total_pgs"] += pool.pg_status.get(
-                        state, 0
-                    )
-
-            # Convert to PoolStateSummary objects
-            pg_states = {}
-            for state, data in pg_state_aggregation.items():
-                pg_states[state] = PoolStateSummary(
+            pg_states = {
+                state: PoolStateSummary(
                     state=state,
-                    pool_count=data["pool_count"],
-                    total_pgs=data["total_pgs"],
+                    pool_count=pool_count,
+                    total_pgs=state_pgs,
                 )
-
-            # Calculate health statistics
-            healthy_pools = len([pool for pool in pools if pool.is_healthy()])
-            unhealthy_pools = total_pools - healthy_pools
+                for state, (pool_count, state_pgs) in pg_state_totals.items()
+            }
 
             return PoolSummary(
                 total_pools=total_pools,
@@ -84,7 +118,7 @@ class PoolClient(BaseCephClient):  # pylint: disable=too-few-public-methods
                 total_pgs=total_pgs,
                 pg_states=pg_states,
                 healthy_pools=healthy_pools,
-                unhealthy_pools=unhealthy_pools,
+                unhealthy_pools=total_pools - healthy_pools,
                 pools=pools,
             )
 
@@ -121,45 +155,35 @@ class PoolClient(BaseCephClient):  # pylint: disable=too-few-public-methods
 
     def _parse_pool_data(self, pool_data: dict) -> Pool:
         """Convert raw pool data to Pool model."""
-        try:
-            # Parse pool options
-            options_data = pool_data.get("options", {})
-            options = PoolOptions(
-                pg_num_max=options_data.get("pg_num_max", 32),
-                pg_num_min=options_data.get("pg_num_min", 1),
-            )
-
-            return Pool(
-                pool_name=pool_data.get("pool_name", "unknown"),
-                type=pool_data.get("type", "unknown"),
-                size=pool_data.get("size", 0),
-                min_size=pool_data.get("min_size", 0),
-                crush_rule=pool_data.get("crush_rule", ""),
-                pg_num=pool_data.get("pg_num", 0),
-                pg_placement_num=pool_data.get("pg_placement_num", 0),
-                pg_placement_num_target=pool_data.get("pg_placement_num_target", 0),
-                pg_num_target=pool_data.get("pg_num_target", 0),
-                options=options,
-                application_metadata=pool_data.get("application_metadata", []),
-                pg_status=pool_data.get("pg_status", {}),
-            )
-
-        except Exception as e:
-            self.logger.error(
-                "Failed to parse pool data", pool_data=pool_data, error=str(e)
-            )
-            # Return a minimal pool object with whatever we can extract
-            return Pool(
-                pool_name=pool_data.get("pool_name", "unknown"),
-                type=pool_data.get("type", "unknown"),
-                size=pool_data.get("size", 0),
-                min_size=pool_data.get("min_size", 0),
-                crush_rule=pool_data.get("crush_rule", ""),
-                pg_num=pool_data.get("pg_num", 0),
-                pg_placement_num=pool_data.get("pg_placement_num", 0),
-                pg_placement_num_target=pool_data.get("pg_placement_num_target", 0),
-                pg_num_target=pool_data.get("pg_num_target", 0),
-                options=PoolOptions(),
-                application_metadata=[],
-                pg_status={},
-            )
+        # Every field is read with a .get() default, so the old broad
+        # try/except and its near-duplicate fallback Pool were dead code.
+        # The one value that can genuinely surprise us is a non-dict
+        # "options"; anything rarer bubbles to the caller, which already
+        # logs and wraps it in CephAPIError.
+        get = pool_data.get
+        options_data = get("options")
+        if not isinstance(options_data, dict):
+            options_data = {}
+
+        # The manager's payload is trusted and every field is already
+        # defaulted via .get(), so skip Pydantic validation here like the
+        # other endpoint parsers do
+        options = PoolOptions.model_construct(
+            pg_num_max=options_data.get("pg_num_max", 32),
+            pg_num_min=options_data.get("pg_num_min", 1),
+        )
+
+        return Pool.model_construct(
+            pool_name=get("pool_name", "unknown"),
+            type=get("type", "unknown"),
+            size=get("size", 0),
+            min_size=get("min_size", 0),
+            crush_rule=get("crush_rule", ""),
+            pg_num=get("pg_num", 0),
+            pg_placement_num=get("pg_placement_num", 0),
+            pg_placement_num_target=get("pg_placement_num_target", 0),
+            pg_num_target=get("pg_num_target", 0),
+            options=options,
+            application_metadata=get("application_metadata", _EMPTY_METADATA),
+            pg_status=get("pg_status", _EMPTY_PG_STATUS),
+        )
@@ -4,6 +4,7 @@ This module defines the configuration settings for the Ceph MCP Server
 using Pydantic.
 """
 
+import functools
 from enum import Enum
 
 from pydantic import FilePath, HttpUrl, SecretStr, field_validator
@@ -61,10 +62,15 @@ class CephMCPSettings(BaseSettings):
     log_format: str = "json"
     max_requests_per_minute: int = 60
     cache_ttl_seconds: int = 30
+    # How long past the TTL a stale summary may still be served while a
+    # background refresh runs (stale-while-revalidate); 0 disables it
+    cache_stale_ttl_seconds: int = 60
 
     # Ceph client HTTP connection Settings
     request_timeout_seconds: int = 5
     max_retries: int = 3
+    retry_base_seconds: float = 0.1
+    retry_cap_seconds: float = 5.0
 
     # Pydantic Settings configuration
     model_config = SettingsConfigDict(
@@ -77,6 +83,7 @@ class CephMCPSettings(BaseSettings):
 settings = CephMCPSettings()  # type: ignore[call-arg]
 
 
+@functools.lru_cache(maxsize=1)
 def get_ssl_context() -> bool | str:
     """
     Configure SSL context for HTTP requests to Ceph.
@@ -84,6 +91,10 @@ def get_ssl_context() -> bool | str:
     This function handles the complexity of SSL configuration, including
     development scenarios where you might need to disable certificate
     verification.
+
+    The result cannot change at runtime, so it is computed once and
+    cached; call get_ssl_context.cache_clear() if settings are ever
+    reloaded.
     """
     if not settings.ceph_ssl_verify:
         # In development, need this for self-signed certificates
@@ -5,7 +5,11 @@ This module provides the base functionality that all domain-specific
 handlers inherit from, ensuring consistent behavior and error handling.
 """
 
+import functools
+import logging
+import time
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import Any
 
 import structlog
@@ -14,6 +18,89 @@ from ceph_mcp.api.base import CephAPIError, CephAuthenticationError
 from ceph_mcp.api.client import CephClient
 from ceph_mcp.models.base import MCPResponse
 
+# Sentinel distinguishing "key absent" from "key present but None" with a
+# single dict probe
+_MISSING = object()
+
+# Exception type -> (log event, message prefix, error code). Resolved via
+# the MRO so subclasses map to their nearest registered ancestor;
+# CephAuthenticationError must therefore come before CephAPIError
+_ERROR_MAP: dict[type, tuple[str, str, str]] = {
+    CephAuthenticationError: (
+        "Authentication error during MCP request",
+        "Authentication failed: ",
+        "AUTHENTICATION_ERROR",
+    ),
+    CephAPIError: (
+        "Ceph API error during MCP request",
+        "Ceph API error: ",
+        "CEPH_API_ERROR",
+    ),
+    ValueError: (
+        "Validation error during MCP request",
+        "Invalid parameters: ",
+        "VALIDATION_ERROR",
+    ),
+}
+
+# Resolved on first use by BaseHandler.get_global_client; importing
+# ceph_mcp.server at module load would be circular
+_get_global_client: Any = None
+
+# (monotonic time, datetime, ISO string) triple backing now_stamp
+_ts_cache: tuple[float, datetime | None, str] = (0.0, None, "")
+# Responses stamped within this window share one formatted timestamp;
+# sub-50 ms resolution is irrelevant for these fields
+_TS_RESOLUTION_SECONDS = 0.05
+
+
+def now_stamp() -> tuple[datetime, str]:
+    """
+    Current local time as a (datetime, ISO string) pair, cached ~50 ms.
+
+    Handlers stamp every response; computing and formatting the clock
+    fresh per call is wasted work when requests land in the same tick.
+    Handlers that need the timestamp both in the payload and on the
+    MCPResponse should take both values from one call rather than
+    letting the model's default_factory hit the clock a second time.
+    """
+    global _ts_cache  # pylint: disable=global-statement
+    now = time.monotonic()
+    cached_at, stamp, value = _ts_cache
+    if stamp is None or now - cached_at > _TS_RESOLUTION_SECONDS:
+        stamp = datetime.now()
+        value = stamp.isoformat()
+        _ts_cache = (now, stamp, value)
+    return stamp, value
+
+
+def now_iso() -> str:
+    """Current local time as an ISO string, cached for ~50 ms."""
+    return now_stamp()[1]
+
+
+@functools.lru_cache(maxsize=None)
+def _get_domain_logger(domain: str) -> Any:
+    """
+    Return the logger for a domain, created once per domain.
+
+    Handlers may be constructed per-request; caching here avoids
+    repeating the f-string formatting and logger-registry lookup each
+    time.
+    """
+    return structlog.get_logger(f"{__name__}.{domain}")
+
+
+@functools.lru_cache(maxsize=None)
+def _get_domain_stdlib_logger(domain: str) -> logging.Logger:
+    """
+    Stdlib logger backing the structlog one for a domain.
+
+    Used for cheap level checks before attaching expensive kwargs to
+    log events.
+    """
+    return logging.getLogger(f"{__name__}.{domain}")
+
 
 class BaseHandler(ABC):
     """
@@ -31,14 +118,35 @@ class BaseHandler(ABC):
             domain: The domain this handler is responsible for (health, hosts, etc.)
         """
         self.domain = domain
-        self.logger = structlog.get_logger(f"{__name__}.{domain}")
+        self.logger = _get_domain_logger(domain)
+        self._stdlib_logger = _get_domain_stdlib_logger(domain)
+        # Operation name -> bound handler method, filled in by subclasses
+        # via register_ops
+        self._ops: dict[str, Any] = {}
+
+    def register_ops(self, ops: dict[str, Any]) -> None:
+        """
+        Register this handler's operation dispatch table.
+
+        Subclasses call this once from __init__ so the table is built a
+        single time per handler instead of on every request.
+
+        Args:
+            ops: Mapping of operation name to bound handler method
+        """
+        self._ops.update(ops)
 
     async def get_global_client(self) -> CephClient:
         """Get the global authenticated Ceph client."""
-        # Import here to avoid circular imports
-        from ceph_mcp.server import get_global_client
+        # Lazy import to avoid circular imports, resolved once instead of
+        # re-importing on every request
+        global _get_global_client  # pylint: disable=global-statement
+        if _get_global_client is None:
+            from ceph_mcp.server import get_global_client
 
-        return await get_global_client()
+            _get_global_client = get_global_client
+
+        return await _get_global_client()
 
     @abstractmethod
     async def _handle_operation(
@@ -72,12 +180,22 @@ class BaseHandler(ABC):
         Returns:
             MCPResponse with the operation result
         """
-        self.logger.info(
-            "Processing MCP request",
-            domain=self.domain,
-            operation=operation,
-            params=params,
-        )
+        # Attach the params dict only when DEBUG is on - serializing
+        # arbitrary nested params on every request is wasted work at the
+        # default INFO level
+        if self._stdlib_logger.isEnabledFor(logging.DEBUG):
+            self.logger.info(
+                "Processing MCP request",
+                domain=self.domain,
+                operation=operation,
+                params=params,
+            )
+        else:
+            self.logger.info(
+                "Processing MCP request",
+                domain=self.domain,
+                operation=operation,
+            )
 
         try:
             # Call the specific handler method
@@ -92,39 +210,24 @@ class BaseHandler(ABC):
 
             return response
 
-        except CephAuthenticationError as e:
+        except (CephAuthenticationError, CephAPIError, ValueError) as e:
+            # One classification table instead of three near-identical
+            # except branches; walk the MRO so exception subclasses hit
+            # their nearest registered ancestor
+            for cls in type(e).__mro__:
+                entry = _ERROR_MAP.get(cls)
+                if entry is not None:
+                    break
+            event, prefix, error_code = entry
             self.logger.error(
-                "Authentication error during MCP request",
-                domain=self.domain,
-                operation=operation,
-                error=str(e),
-            )
-            return MCPResponse.error_response(
-                message=f"Authentication failed: {str(e)}",
-                error_code="AUTHENTICATION_ERROR",
-            )
-
-        except CephAPIError as e:
-            self.logger.error(
-                "Ceph API error during MCP request",
+                event,
                 domain=self.domain,
                 operation=operation,
                 error=str(e),
                 status_code=getattr(e, "status_code", None),
             )
             return MCPResponse.error_response(
-                message=f"Ceph API error: {str(e)}", error_code="CEPH_API_ERROR"
-            )
-
-        except ValueError as e:
-            self.logger.error(
-                "Validation error during MCP request",
-                domain=self.domain,
-                operation=operation,
-                error=str(e),
-            )
-            return MCPResponse.error_response(
-                message=f"Invalid parameters: {str(e)}", error_code="VALIDATION_ERROR"
+                message=prefix + str(e), error_code=error_code
             )
 
         except Exception as e:  # pylint: disable=broad-exception-caught
@@ -153,10 +256,15 @@ class BaseHandler(ABC):
         Raises:
             ValueError: If any required parameter is missing
         """
-        if len(required_keys) == 0:
+        if not required_keys:
             return
+        # One probe per key: params.get with a sentinel replaces the
+        # "key not in params or params[key] is None" double lookup
+        get = params.get
         missing_keys = [
-            key for key in required_keys if key not in params or params[key] is None
+            key
+            for key in required_keys
+            if (value := get(key, _MISSING)) is _MISSING or value is None
         ]
         if missing_keys:
             raise ValueError(f"Missing required parameters: {', '.join(missing_keys)}")
@@ -175,7 +283,14 @@ class BaseHandler(ABC):
         Raises:
             ValueError: If parameter type doesn't match
         """
-        if key in params and not isinstance(params[key], expected_type):
+        value = params.get(key, _MISSING)
+        if value is _MISSING:
+            return
+        # Exact-type match first: skips isinstance's MRO walk for the
+        # common str/int/dict cases; subclasses fall through to isinstance
+        if type(value) is expected_type:
+            return
+        if not isinstance(value, expected_type):
             raise ValueError(
                 f"Parameter '{key}' must be of type {expected_type.__name__}"
             )
@@ -4,13 +4,24 @@ CephFS Domain Handlers
 This module contains all MCP request handlers related to cluster CephFS filesystems.
 """
 
-from datetime import datetime
 from typing import Any
 
-from ceph_mcp.handlers.base import BaseHandler
+from ceph_mcp.handlers.base import BaseHandler, now_iso
 from ceph_mcp.models.base import MCPResponse
 
 
+def _format_pool_stats(pool: Any) -> dict[str, Any] | None:
+    """Format a pool's usage statistics, or None when the pool is absent."""
+    if pool is None:
+        return None
+    return {
+        "name": pool.pool,
+        "used_gb": round(pool.get_used_gb(), 2),
+        "total_gb": round(pool.get_total_gb(), 2),
+        "used_percent": round(pool.get_used_percent(), 1),
+    }
+
+
 class CephFSHandlers(BaseHandler):
     """
     Handlers for CephFS-related MCP operations.
@@ -21,23 +32,27 @@ class CephFSHandlers(BaseHandler):
 
     def __init__(self) -> None:
         super().__init__(domain="cephfs")
+        # Built once per handler; _handle_operation used to rebuild
+        # this dict (and its bound methods) on every request
+        self.register_ops(
+            {
+                "get_fs_summary": self.get_fs_summary,
+                "get_fs_details": self.get_fs_details,
+            }
+        )
 
     async def _handle_operation(
         self, operation: str, params: dict[str, Any]
     ) -> MCPResponse:
         """Route CephFS operations to appropriate methods."""
-        operation_map = {
-            "get_fs_summary": self.get_fs_summary,
-            "get_fs_details": self.get_fs_details,
-        }
-
-        if operation not in operation_map:
+        handler = self._ops.get(operation)
+        if handler is None:
             return self.create_error_response(
                 message=f"Unknown CephFS operation: {operation}",
                 error_code="UNKNOWN_OPERATION",
             )
 
-        return await operation_map[operation](params)
+        return await handler(params)
 
     async def get_fs_summary(self, params: dict[str, Any]) -> MCPResponse:
         """
@@ -55,25 +70,38 @@ class CephFSHandlers(BaseHandler):
         # Get CephFS summary data
         fs_summary = await client.cephfs.get_fs_summary()
 
+        # Build the filesystem list, name/id projections and mapping in a
+        # single pass instead of one iteration per view
+        fs_list = []
+        names = []
+        ids = []
+        mapping = {}
+        for fs in fs_summary.filesystems:
+            fs_id = fs.get_fs_id()
+            fs_name = fs.get_fs_name()
+            fs_list.append(
+                {
+                    "fs_id": fs_id,
+                    "fs_name": fs_name,
+                    "display_name": fs.get_display_name(),
+                }
+            )
+            names.append(fs_name)
+            ids.append(fs_id)
+            mapping[fs_name] = fs_id
+
         # Format response data
         summary_data = {
             "cluster_summary": {
                 "total_filesystems": fs_summary.total_filesystems,
                 "filesystem_count": len(fs_summary.filesystems),
             },
-            "filesystems": [
-                {
-                    "fs_id": fs.get_fs_id(),
-                    "fs_name": fs.get_fs_name(),
-                    "display_name": fs.get_display_name(),
-                }
-                for fs in fs_summary.filesystems
-            ],
-            "filesystem_names": fs_summary.get_filesystem_names(),
-            "filesystem_ids": fs_summary.get_filesystem_ids(),
-            "name_id_mapping": fs_summary.get_name_id_mapping(),
+            "filesystems": fs_list,
+            "filesystem_names": names,
+            "filesystem_ids": ids,
+            "name_id_mapping": mapping,
             "summary_text": fs_summary.get_summary_text(),
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso(),
         }
 
         # Generate appropriate message
@@ -115,6 +143,15 @@ class CephFSHandlers(BaseHandler):
         metadata_pool = fs_details.get_metadata_pool()
         data_pool = fs_details.get_data_pool()
 
+        # Stamp once and format each pool's statistics once via the
+        # shared helper instead of duplicating the dict construction
+        timestamp = now_iso()
+        metadata_pool_stats = _format_pool_stats(metadata_pool)
+        data_pool_stats = _format_pool_stats(data_pool)
+
+        # Counted once and reused in both the summary block and the message
+        active_ranks = sum(1 for r in fs_details.ranks if r.state == "active")
+
         details_data = {
             "filesystem_info": {
                 "fs_id": fs_details.id,
@@ -130,56 +167,17 @@ class CephFSHandlers(BaseHandler):
                 for rank in fs_details.ranks
             ],
             "pool_statistics": {
-                "metadata_pool": (
-                    {
-                        "name": metadata_pool.pool if metadata_pool else "none",
-                        "used_gb": (
-                            round(metadata_pool.get_used_gb(), 2)
-                            if metadata_pool
-                            else 0
-                        ),
-                        "total_gb": (
-                            round(metadata_pool.get_total_gb(), 2)
-                            if metadata_pool
-                            else 0
-                        ),
-                        "used_percent": (
-                            round(metadata_pool.get_used_percent(), 1)
-                            if metadata_pool
-                            else 0
-                        ),
-                    }
-                    if metadata_pool
-                    else None
-                ),
-                "data_pool": (
-                    {
-                        "name": data_pool.pool if data_pool else "none",
-                        "used_gb": (
-                            round(data_pool.get_used_gb(), 2) if data_pool else 0
-                        ),
-                        "total_gb": (
-                            round(data_pool.get_total_gb(), 2) if data_pool else 0
-                        ),
-                        "used_percent": (
-                            round(data_pool.get_used_percent(), 1) if data_pool else 0
-                        ),
-                    }
-                    if data_pool
-                    else None
-                ),
+                "metadata_pool": metadata_pool_stats,
+                "data_pool": data_pool_stats,
             },
             "summary": {
-                "active_ranks": len(
-                    [r for r in fs_details.ranks if r.state == "active"]
-                ),
+                "active_ranks": active_ranks,
                 "total_ranks": len(fs_details.ranks),
             },
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
         }
 
         # Generate message
-        active_ranks = len([r for r in fs_details.ranks if r.state == "active"])
         message = f"Filesystem '{fs_details.name}' (ID: {fs_details.id}) - {fs_details.client_count} clients, {active_ranks} active MDS ranks"
 
         return self.create_success_response(data=details_data, message=message)
@@ -0,0 +1,126 @@
+"""
+Cluster Domain Handlers
+
+This module contains MCP request handlers for cluster-wide composite
+operations that span multiple domains.
+"""
+
+from typing import Any
+
+from ceph_mcp.handlers.base import BaseHandler, now_iso
+from ceph_mcp.models.base import MCPResponse
+
+
+class ClusterHandlers(BaseHandler):
+    """
+    Handlers for cluster-wide composite MCP operations.
+
+    This class aggregates information from all domains into a single
+    overview so AI assistants can get the full cluster picture in one call.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(domain="cluster")
+        # Built once per handler; _handle_operation used to rebuild
+        # this dict (and its bound methods) on every request
+        self.register_ops(
+            {
+                "get_cluster_overview": self.get_cluster_overview,
+            }
+        )
+
+    async def _handle_operation(
+        self, operation: str, params: dict[str, Any]
+    ) -> MCPResponse:
+        """Route cluster operations to appropriate methods."""
+        handler = self._ops.get(operation)
+        if handler is None:
+            return self.create_error_response(
+                message=f"Unknown cluster operation: {operation}",
+                error_code="UNKNOWN_OPERATION",
+            )
+
+        return await handler(params)
+
+    async def get_cluster_overview(self, params: dict[str, Any]) -> MCPResponse:
+        """
+        Get an aggregated overview of the entire cluster.
+
+        This fans out to all domain summary endpoints concurrently and
+        combines the results, replacing a six-call sequence with one.
+        """
+        # Validate required parameters
+        self.validate_required_params(params, [])
+
+        # Use global client instead of creating new one
+        client = await self.get_global_client()
+
+        overview = await client.get_cluster_overview()
+
+        # Format response data
+        overview_data = {
+            "health": (
+                {
+                    "status": overview.health.status.value,
+                    "executive_summary": overview.health.get_executive_summary(),
+                    "health_score": overview.health.get_health_score(),
+                }
+                if overview.health
+                else None
+            ),
+            "hosts": (
+                {
+                    "total_hosts": overview.hosts.total_hosts,
+                    "online_hosts": overview.hosts.online_hosts,
+                    "offline_hosts": overview.hosts.offline_hosts,
+                }
+                if overview.hosts
+                else None
+            ),
+            "daemons": (
+                {
+                    "total_daemons": overview.daemons.total_daemons,
+                    "running_daemons": overview.daemons.running_daemons,
+                    "stopped_daemons": overview.daemons.stopped_daemons,
+                }
+                if overview.daemons
+                else None
+            ),
+            "osds": (
+                {
+                    "total_osds": overview.osds.total_osds,
+                    "up_osds": overview.osds.up_osds,
+                    "down_osds": overview.osds.down_osds,
+                }
+                if overview.osds
+                else None
+            ),
+            "pools": (
+                {
+                    "total_pools": overview.pools.total_pools,
+                    "healthy_pools": overview.pools.healthy_pools,
+                    "unhealthy_pools": overview.pools.unhealthy_pools,
+                }
+                if overview.pools
+                else None
+            ),
+            "filesystems": (
+                {
+                    "total_filesystems": overview.filesystems.total_filesystems,
+                    "filesystem_names": overview.filesystems.filesystem_names,
+                }
+                if overview.filesystems
+                else None
+            ),
+            "errors": overview.errors,
+            "timestamp": now_iso(),
+        }
+
+        # Generate appropriate message
+        if overview.is_complete():
+            message = "Cluster overview collected from all components"
+        else:
+            failed = ", ".join(overview.get_failed_components())
+            message = f"Cluster overview collected with failures in: {failed}"
+
+        return self.create_success_response(data=overview_data, message=message)
@@ -7,10 +7,16 @@ This module contains all MCP request handlers related to cluster daemons.
 from datetime import datetime
 from typing import Any
 
-from ceph_mcp.handlers.base import BaseHandler
+from ceph_mcp.handlers.base import BaseHandler, now_iso
 from ceph_mcp.models.base import MCPResponse
 
 
+# Actions accepted by the manager; frozen at module scope so each
+# call does a hashed membership test with no per-call allocation
+_VALID_DAEMON_ACTIONS = frozenset({"start", "stop", "restart"})
+_VALID_DAEMON_ACTIONS_STR = "start, stop, restart"
+
+
 class DaemonHandlers(BaseHandler):
     """
     Handlers for daemon-related MCP operations.
@@ -21,25 +27,29 @@ class DaemonHandlers(BaseHandler):
 
     def __init__(self) -> None:
         super().__init__(domain="daemon")
+        # Built once per handler; _handle_operation used to rebuild
+        # this dict (and its bound methods) on every request
+        self.register_ops(
+            {
+                "get_daemon_summary": self.get_daemon_summary,
+                "get_daemon_names": self.get_daemon_names,
+                "get_daemon_details": self.get_daemon_details,
+                "perform_daemon_action": self.perform_daemon_action,
+            }
+        )
 
     async def _handle_operation(
         self, operation: str, params: dict[str, Any]
     ) -> MCPResponse:
         """Route daemon operations to appropriate methods."""
-        operation_map = {
-            "get_daemon_summary": self.get_daemon_summary,
-            "get_daemon_names": self.get_daemon_names,
-            "get_daemon_details": self.get_daemon_details,
-            "perform_daemon_action": self.perform_daemon_action,
-        }
-
-        if operation not in operation_map:
+        handler = self._ops.get(operation)
+        if handler is None:
             return self.create_error_response(
                 message=f"Unknown daemon operation: {operation}",
                 error_code="UNKNOWN_OPERATION",
             )
 
-        return await operation_map[operation](params)
+        return await handler(params)
 
     async def get_daemon_summary(self, params: dict[str, Any]) -> MCPResponse:
         """
@@ -57,34 +67,43 @@ class DaemonHandlers(BaseHandler):
         # Get daemon summary data
         daemon_summary = await client.daemon.get_daemon_summary()
 
+        # Bind the top-level tallies once; they feed both the response
+        # data and the message below
+        total_daemons = daemon_summary.total_daemons
+        running_daemons = daemon_summary.running_daemons
+        stopped_daemons = daemon_summary.stopped_daemons
+
+        # Serialize the per-type summaries with an explicit loop so each
+        # type summary's attributes are resolved once
+        daemon_types = {}
+        for daemon_type, type_summary in daemon_summary.daemon_types.items():
+            daemon_types[daemon_type] = {
+                "total_count": type_summary.total_count,
+                "running_count": type_summary.running_count,
+                "stopped_count": type_summary.stopped_count,
+                "daemon_names": type_summary.daemon_names,
+            }
+
         # Format response data
         summary_data = {
             "cluster_summary": {
-                "total_daemons": daemon_summary.total_daemons,
-                "running_daemons": daemon_summary.running_daemons,
-                "stopped_daemons": daemon_summary.stopped_daemons,
-                "daemon_type_count": len(daemon_summary.daemon_types),
-            },
-            "daemon_types": {
-                daemon_type: {
-                    "total_count": type_summary.total_count,
-                    "running_count": type_summary.running_count,
-                    "stopped_count": type_summary.stopped_count,
-                    "daemon_names": type_summary.daemon_names,
-                }
-                for daemon_type, type_summary in daemon_summary.daemon_types.items()
+                "total_daemons": total_daemons,
+                "running_daemons": running_daemons,
+                "stopped_daemons": stopped_daemons,
+                "daemon_type_count": len(daemon_types),
             },
+            "daemon_types": daemon_types,
             "all_daemon_names": [
                 daemon.daemon_name for daemon in daemon_summary.daemons
             ],
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso(),
         }
 
         # Generate appropriate message
-        if daemon_summary.stopped_daemons == 0:
-            message = f"All {daemon_summary.total_daemons} daemons are running across {len(daemon_summary.daemon_types)} daemon types"
+        if stopped_daemons == 0:
+            message = f"All {total_daemons} daemons are running across {len(daemon_types)} daemon types"
         else:
-            message = f"Cluster has {daemon_summary.total_daemons} daemons: {daemon_summary.running_daemons} running, {daemon_summary.stopped_daemons} stopped"
+            message = f"Cluster has {total_daemons} daemons: {running_daemons} running, {stopped_daemons} stopped"
 
         return self.create_success_response(data=summary_data, message=message)
 
@@ -113,7 +132,7 @@ class DaemonHandlers(BaseHandler):
                 "running_count": daemon_type_info.running_count,
                 "stopped_count": daemon_type_info.stopped_count,
             },
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso(),
         }
 
         # Generate descriptive message
@@ -130,11 +149,16 @@ class DaemonHandlers(BaseHandler):
 
         This provides comprehensive daemon facts for troubleshooting
         and detailed system analysis.
+
+        The optional "fields" parameter lists which sections to include
+        ("basic_info", "version_info", "resource_usage"); omitted
+        sections are neither computed nor serialized.
         """
         # Validate required parameters
         self.validate_required_params(params, ["hostname", "daemon_name"])
         hostname = params["hostname"]
         daemon_name = params["daemon_name"]
+        fields = self.get_optional_param(params, "fields", None)
 
         # Use global client instead of creating new one
         client = await self.get_global_client()
@@ -142,45 +166,49 @@ class DaemonHandlers(BaseHandler):
         # Get detailed daemon information
         daemon = await client.daemon.get_daemon_details(hostname, daemon_name)
 
-        # Format detailed response
-        daemon_details = {
-            "basic_info": {
+        # Resolve values needed more than once up front: the start time
+        # feeds two fields plus the uptime computation, and the status,
+        # memory and timestamp each appear in both the payload and message
+        started = daemon.get_started_datetime()
+        status_display = daemon.get_status_display()
+        memory_usage_gb = daemon.get_memory_usage_gb()
+        timestamp = now_iso()
+
+        # Format detailed response, section by section so unrequested
+        # sections skip both the conversions and the payload bytes
+        daemon_details: dict[str, Any] = {}
+        if not fields or "basic_info" in fields:
+            daemon_details["basic_info"] = {
                 "daemon_id": daemon.daemon_id,
                 "daemon_type": daemon.daemon_type,
                 "daemon_name": daemon.daemon_name,
                 "hostname": daemon.hostname,
-                "status": daemon.get_status_display(),
+                "status": status_display,
                 "status_code": daemon.status,
-            },
-            "version_info": {
+            }
+        if not fields or "version_info" in fields:
+            daemon_details["version_info"] = {
                 "ceph_version": daemon.version,
                 "systemd_unit": daemon.systemd_unit,
                 "started": daemon.started,
-                "started_datetime": (
-                    daemon.get_started_datetime().isoformat()
-                    if daemon.get_started_datetime()
-                    else None
-                ),
-            },
-            "resource_usage": {
-                "memory_usage_gb": daemon.get_memory_usage_gb(),
+                "started_datetime": started.isoformat() if started else None,
+            }
+        if not fields or "resource_usage" in fields:
+            daemon_details["resource_usage"] = {
+                "memory_usage_gb": memory_usage_gb,
                 "memory_request_gb": daemon.get_memory_request_gb(),
                 "cpu_percentage": daemon.cpu_percentage,
                 "cpu_percentage_float": daemon.get_cpu_percentage_float(),
-            },
-            "timestamp": datetime.now().isoformat(),
-        }
+            }
+        daemon_details["timestamp"] = timestamp
 
         # Generate descriptive message
         uptime_info = ""
-        if daemon.get_started_datetime():
-            uptime_days = (
-                datetime.now(daemon.get_started_datetime().tzinfo)
-                - daemon.get_started_datetime()
-            ).days
+        if started:
+            uptime_days = (datetime.now(started.tzinfo) - started).days
             uptime_info = f", running for {uptime_days} days"
 
-        message = f"Daemon '{daemon_name}' on '{hostname}' is {daemon.get_status_display()} using {daemon.get_memory_usage_gb()}GB memory and {daemon.cpu_percentage} CPU{uptime_info}"
+        message = f"Daemon '{daemon_name}' on '{hostname}' is {status_display} using {memory_usage_gb}GB memory and {daemon.cpu_percentage} CPU{uptime_info}"
 
         return self.create_success_response(data=daemon_details, message=message)
 
@@ -197,10 +225,9 @@ class DaemonHandlers(BaseHandler):
         action = params["action"]
 
         # Validate action
-        valid_actions = ["start", "stop", "restart"]
-        if action not in valid_actions:
+        if action not in _VALID_DAEMON_ACTIONS:
             return self.create_error_response(
-                message=f"Invalid action '{action}'. Valid actions: {', '.join(valid_actions)}",
+                message=f"Invalid action '{action}'. Valid actions: {_VALID_DAEMON_ACTIONS_STR}",
                 error_code="VALIDATION_ERROR",
             )
 
@@ -218,7 +245,7 @@ class DaemonHandlers(BaseHandler):
                 "success": action_result["success"],
             },
             "api_response": action_result.get("response", {}),
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso(),
         }
 
         # Generate descriptive message
@@ -4,10 +4,9 @@ Health Domain Handlers
 This module contains all MCP request handlers related to cluster health.
 """
 
-from datetime import datetime
 from typing import Any
 
-from ceph_mcp.handlers.base import BaseHandler
+from ceph_mcp.handlers.base import BaseHandler, now_iso
 from ceph_mcp.models.base import MCPResponse
 
 
@@ -21,25 +20,29 @@ class HealthHandlers(BaseHandler):
 
     def __init__(self) -> None:
         super().__init__(domain="health")
+        # Built once per handler; _handle_operation used to rebuild
+        # this dict (and its bound methods) on every request
+        self.register_ops(
+            {
+                "get_health_summary": self.get_health_summary,
+                "get_health_details": self.get_health_details,
+                "get_health_recommendations": self.get_health_recommendations,
+                "get_cluster_capacity": self.get_cluster_capacity,
+            }
+        )
 
     async def _handle_operation(
         self, operation: str, params: dict[str, Any]
     ) -> MCPResponse:
         """Route health operations to appropriate methods."""
-        operation_map = {
-            "get_health_summary": self.get_health_summary,
-            "get_health_details": self.get_health_details,
-            "get_health_recommendations": self.get_health_recommendations,
-            "get_cluster_capacity": self.get_cluster_capacity,
-        }
-
-        if operation not in operation_map:
+        handler = self._ops.get(operation)
+        if handler is None:
             return self.create_error_response(
                 message=f"Unknown health operation: {operation}",
                 error_code="UNKNOWN_OPERATION",
             )
 
-        return await operation_map[operation](params)
+        return await handler(params)
 
     async def get_health_summary(self, params: dict[str, Any]) -> MCPResponse:
         """
@@ -57,32 +60,41 @@ class HealthHandlers(BaseHandler):
         # Get raw health data
         health = await client.health.get_cluster_health()
 
+        # Each of these walks the checks list, so resolve them once and
+        # reuse the results in both the payload and the message
+        health_score = health.get_health_score()
+        is_healthy = health.is_healthy()
+        has_errors = health.has_errors()
+        critical_checks, warning_checks = health.partition_checks()
+        critical_count = len(critical_checks)
+        warning_count = len(warning_checks)
+
         # Format response data
         summary_data = {
             "executive_summary": health.get_executive_summary(),
-            "health_score": health.get_health_score(),
+            "health_score": health_score,
             "status": health.status.value,
             "cluster_fsid": health.cluster_fsid,
-            "is_healthy": health.is_healthy(),
+            "is_healthy": is_healthy,
             "has_warnings": health.has_warnings(),
-            "has_errors": health.has_errors(),
+            "has_errors": has_errors,
             "description": health.overall_status_description,
             "checks_summary": {
                 "total": len(health.checks),
-                "critical": len(health.get_critical_checks()),
-                "warnings": len(health.get_warning_checks()),
+                "critical": critical_count,
+                "warnings": warning_count,
             },
             "recommendations": health.get_recommendations(),
             "timestamp": health.collected_at.isoformat(),
         }
 
         # Generate appropriate message
-        if health.is_healthy():
-            message = f"Cluster is healthy (Score: {health.get_health_score()}/100)"
-        elif health.has_errors():
-            message = f"Cluster has {len(health.get_critical_checks())} critical issue(s) requiring immediate attention"
+        if is_healthy:
+            message = f"Cluster is healthy (Score: {health_score}/100)"
+        elif has_errors:
+            message = f"Cluster has {critical_count} critical issue(s) requiring immediate attention"
         else:
-            message = f"Cluster has {len(health.get_warning_checks())} warning(s) that should be investigated"
+            message = f"Cluster has {warning_count} warning(s) that should be investigated"
 
         response = self.create_success_response(data=summary_data, message=message)
 
@@ -102,63 +114,69 @@ class HealthHandlers(BaseHandler):
         client = await self.get_global_client()
 
         health = await client.health.get_cluster_health()
-        # Sort checks by priority
-        checks_by_priority = health.get_checks_by_priority()
 
-        # Apply severity filter if specified
+        # The manager API has no severity parameter, so filter here - but
+        # before sorting, so only the surviving checks pay for the
+        # priority-score key instead of sorting the full list and then
+        # discarding most of it
         if severity_filter:
-            checks_by_priority = [
+            filtered = [
                 check
-                for check in checks_by_priority
+                for check in health.checks
                 if check.severity.value == severity_filter
             ]
-
-        # Format detailed response
-        health_details = {
-            "overall_status": health.status.value,
-            "health_score": health.get_health_score(),
-            "description": health.overall_status_description,
-            "checks": [
+            checks_by_priority = sorted(
+                filtered, key=lambda x: x.get_priority_score(), reverse=True
+            )
+        else:
+            checks_by_priority = health.get_checks_by_priority()
+
+        # Single pass: serialize each check and tally critical/warning
+        # counts from the same is_critical()/is_warning() calls instead of
+        # re-walking the list for every statistic and again for the message
+        checks_out = []
+        critical_count = warning_count = 0
+        for check in checks_by_priority:
+            is_critical = check.is_critical()
+            is_warning = check.is_warning()
+            critical_count += is_critical
+            warning_count += is_warning
+            checks_out.append(
                 {
                     "type": check.type,
                     "severity": check.severity.value,
                     "summary": check.summary,
                     "detail": check.details,
                     "count": check.count,
-                    "is_critical": check.is_critical(),
-                    "is_warning": check.is_warning(),
+                    "is_critical": is_critical,
+                    "is_warning": is_warning,
                     "priority_score": check.get_priority_score(),
                 }
-                for check in checks_by_priority
-            ],
+            )
+
+        # Format detailed response
+        health_details = {
+            "overall_status": health.status.value,
+            "health_score": health.get_health_score(),
+            "description": health.overall_status_description,
+            "checks": checks_out,
             "check_statistics": {
-                "total_checks": len(checks_by_priority),
-                "critical_count": len(
-                    [check for check in checks_by_priority if check.is_critical()]
-                ),
-                "warning_count": len(
-                    [check for check in checks_by_priority if check.is_warning()]
-                ),
+                "total_checks": len(checks_out),
+                "critical_count": critical_count,
+                "warning_count": warning_count,
                 "filtered_by_severity": severity_filter,
             },
             "recommendations": health.get_recommendations(),
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso(),
         }
 
         # Generate message based on findings
-        if not checks_by_priority:
+        if not checks_out:
             if severity_filter:
                 message = f"No health checks found with severity '{severity_filter}'"
             else:
                 message = "Cluster is healthy with no active health checks"
         else:
-            critical_count = len(
-                [check for check in checks_by_priority if check.is_critical()]
-            )
-            warning_count = len(
-                [check for check in checks_by_priority if check.is_warning()]
-            )
-
             parts = []
             if critical_count > 0:
                 parts.append(f"{critical_count} critical issue(s)")
@@ -183,29 +201,30 @@ class HealthHandlers(BaseHandler):
 
         health = await client.health.get_cluster_health()
 
-        # Get comprehensive recommendations
-        recommendations = health.get_recommendations()
+        # Get comprehensive recommendations; bound once since the full
+        # list is needed again for total_available after slicing
+        all_recommendations = health.get_recommendations()
+        recommendations = all_recommendations
 
         # If priority_only is True, filter to most important items
         if priority_only:
+            # Both groups come from one walk over the checks list
+            critical_checks, warning_checks = health.partition_checks()
             # Focus on critical issues first
-            critical_checks = health.get_critical_checks()
             if critical_checks:
                 recommendations = [
                     "🚨 Critical issues require immediate attention:",
                     *[f"   - {check.summary}" for check in critical_checks[:3]],
                 ]
+            elif warning_checks:
+                recommendations = [
+                    "⚠️ Address these warnings when possible:",
+                    *[f"   - {check.summary}" for check in warning_checks[:3]],
+                ]
             else:
-                warning_checks = health.get_warning_checks()
-                if warning_checks:
-                    recommendations = [
-                        "⚠️ Address these warnings when possible:",
-                        *[f"   - {check.summary}" for check in warning_checks[:3]],
-                    ]
-                else:
-                    recommendations = [
-                        "✅ No immediate action required - cluster is healthy"
-                    ]
+                recommendations = [
+                    "✅ No immediate action required - cluster is healthy"
+                ]
 
         # Limit number of recommendations
         recommendations = recommendations[:max_recommendations]
@@ -215,9 +234,9 @@ class HealthHandlers(BaseHandler):
             "health_score": health.get_health_score(),
             "priority_filter_applied": priority_only,
             "max_items": max_recommendations,
-            "total_available": len(health.get_recommendations()),
+            "total_available": len(all_recommendations),
             "cluster_status": health.status.value,
-            "generated_at": datetime.now().isoformat(),
+            "generated_at": now_iso(),
         }
 
         message = f"Generated {len(recommendations)} health recommendations"
@@ -261,7 +280,7 @@ class HealthHandlers(BaseHandler):
                 "average_object_size": capacity.average_object_size,
             },
             "summary": capacity.get_capacity_summary(),
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso(),
         }
 
         # Generate descriptive message
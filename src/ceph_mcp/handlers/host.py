@@ -4,13 +4,26 @@ Host Domain Handlers
 This module contains all MCP request handlers related to cluster hosts.
 """
 
-from datetime import datetime
 from typing import Any
 
-from ceph_mcp.handlers.base import BaseHandler
+from ceph_mcp.handlers.base import BaseHandler, now_iso
 from ceph_mcp.models.base import MCPResponse
 
 
+def _serialize_host(host: Any) -> dict[str, Any]:
+    """Summary-view projection of one host."""
+    return {
+        "hostname": host.hostname,
+        "address": host.addr,
+        "status": host.get_status_display(),
+        "services": host.get_service_summary(),
+        "uptime_days": host.get_uptime_days(),
+        "memory_total_gb": host.get_memory_total_gb(),
+        "architecture": host.arch,
+        "labels": host.labels,
+    }
+
+
 class HostHandlers(BaseHandler):
     """
     Handlers for host-related MCP operations.
@@ -21,23 +34,27 @@ class HostHandlers(BaseHandler):
 
     def __init__(self) -> None:
         super().__init__(domain="host")
+        # Built once per handler; _handle_operation used to rebuild
+        # this dict (and its bound methods) on every request
+        self.register_ops(
+            {
+                "get_host_summary": self.get_host_summary,
+                "get_host_details": self.get_host_details,
+            }
+        )
 
     async def _handle_operation(
         self, operation: str, params: dict[str, Any]
     ) -> MCPResponse:
         """Route host operations to appropriate methods."""
-        operation_map = {
-            "get_host_summary": self.get_host_summary,
-            "get_host_details": self.get_host_details,
-        }
-
-        if operation not in operation_map:
+        handler = self._ops.get(operation)
+        if handler is None:
             return self.create_error_response(
                 message=f"Unknown host operation: {operation}",
                 error_code="UNKNOWN_OPERATION",
             )
 
-        return await operation_map[operation](params)
+        return await handler(params)
 
     async def get_host_summary(self, params: dict[str, Any]) -> MCPResponse:
         """
@@ -55,6 +72,11 @@ class HostHandlers(BaseHandler):
         # Get host summary data
         host_summary = await client.host.get_host_summary()
 
+        # Hot loop for large clusters: serialize through a module-level
+        # helper bound to a local, one name lookup per host instead of
+        # rebuilding the dict literal with inline method chains
+        serialize = _serialize_host
+
         # Format response data
         summary_data = {
             "cluster_summary": {
@@ -70,20 +92,8 @@ class HostHandlers(BaseHandler):
                     else 0
                 ),
             },
-            "hosts": [
-                {
-                    "hostname": host.hostname,
-                    "address": host.addr,
-                    "status": host.get_status_display(),
-                    "services": host.get_service_summary(),
-                    "uptime_days": host.get_uptime_days(),
-                    "memory_total_gb": host.get_memory_total_gb(),
-                    "architecture": host.arch,
-                    "labels": host.labels,
-                }
-                for host in host_summary.hosts
-            ],
-            "timestamp": datetime.now().isoformat(),
+            "hosts": [serialize(host) for host in host_summary.hosts],
+            "timestamp": now_iso(),
         }
 
         # Generate appropriate message
@@ -100,10 +110,15 @@ class HostHandlers(BaseHandler):
 
         This provides comprehensive host facts for troubleshooting
         and detailed system analysis.
+
+        The optional "fields" parameter lists which sections to include
+        ("basic_info", "services", "hardware", "memory", "system");
+        omitted sections are neither computed nor serialized.
         """
         # Validate required parameters
         self.validate_required_params(params, ["hostname"])
         hostname = params["hostname"]
+        fields = self.get_optional_param(params, "fields", None)
 
         # Use global client instead of creating new one
         client = await self.get_global_client()
@@ -111,18 +126,28 @@ class HostHandlers(BaseHandler):
         # Get detailed host information
         host = await client.host.get_host_details(hostname)
 
-        # Format detailed response
-        host_details = {
-            "basic_info": {
+        # Compute the memory figures once: total and free each fed the
+        # memory dict, the used-GB subtraction and the usage percentage
+        mem_total = host.get_memory_total_gb()
+        mem_free = host.get_memory_free_gb()
+        mem_used = round(mem_total - mem_free, 2)
+        status_display = host.get_status_display()
+
+        # Format detailed response, section by section so unrequested
+        # sections skip both the conversions and the payload bytes
+        host_details: dict[str, Any] = {}
+        if not fields or "basic_info" in fields:
+            host_details["basic_info"] = {
                 "hostname": host.hostname,
                 "fqdn": host.fqdn,
                 "shortname": host.shortname,
                 "address": host.addr,
-                "status": host.get_status_display(),
+                "status": status_display,
                 "labels": host.labels,
                 "uptime_days": host.get_uptime_days(),
-            },
-            "services": {
+            }
+        if not fields or "services" in fields:
+            host_details["services"] = {
                 "summary": host.get_service_summary(),
                 "instances": [
                     {
@@ -131,44 +156,35 @@ class HostHandlers(BaseHandler):
                     }
                     for service in host.service_instances
                 ],
-            },
-            "hardware": {
+            }
+        if not fields or "hardware" in fields:
+            host_details["hardware"] = {
                 "architecture": host.arch,
                 "cpu_model": host.cpu_model,
                 "cpu_cores": host.cpu_cores,
                 "cpu_count": host.cpu_count,
                 "cpu_threads": host.cpu_threads,
-            },
-            "memory": {
-                "total_gb": host.get_memory_total_gb(),
+            }
+        if not fields or "memory" in fields:
+            host_details["memory"] = {
+                "total_gb": mem_total,
                 "available_gb": host.get_memory_available_gb(),
-                "free_gb": host.get_memory_free_gb(),
-                "used_gb": round(
-                    host.get_memory_total_gb() - host.get_memory_free_gb(), 2
-                ),
-            },
-            "system": {
+                "free_gb": mem_free,
+                "used_gb": mem_used,
+            }
+        if not fields or "system" in fields:
+            host_details["system"] = {
                 "operating_system": host.operating_system,
                 "kernel_version": host.kernel,
                 "system_uptime_seconds": host.system_uptime,
-            },
-            "timestamp": datetime.now().isoformat(),
-        }
+            }
+        host_details["timestamp"] = now_iso()
 
         # Generate descriptive message
         memory_usage_pct = (
-            round(
-                (
-                    (host.get_memory_total_gb() - host.get_memory_free_gb())
-                    / host.get_memory_total_gb()
-                    * 100
-                ),
-                1,
-            )
-            if host.get_memory_total_gb() > 0
-            else 0
+            round(mem_used / mem_total * 100, 1) if mem_total > 0 else 0
         )
 
-        message = f"Host '{hostname}' is {host.get_status_display()} with {len(host.service_instances)} service types running, {memory_usage_pct}% memory usage"
+        message = f"Host '{hostname}' is {status_display} with {len(host.service_instances)} service types running, {memory_usage_pct}% memory usage"
 
         return self.create_success_response(data=host_details, message=message)
@@ -4,13 +4,18 @@ OSD Domain Handlers
 This module contains all MCP request handlers related to cluster OSDs.
 """
 
-from datetime import datetime
 from typing import Any
 
-from ceph_mcp.handlers.base import BaseHandler
+from ceph_mcp.handlers.base import BaseHandler, now_stamp
 from ceph_mcp.models.base import MCPResponse
 
 
+# Actions accepted by the manager; frozen at module scope so each
+# call does a hashed membership test with no per-call allocation
+_VALID_MARK_ACTIONS = frozenset({"noout", "out", "in"})
+_VALID_MARK_ACTIONS_STR = "noout, out, in"
+
+
 class OSDHandlers(BaseHandler):
     """
     Handlers for OSD-related MCP operations.
@@ -21,25 +26,29 @@ class OSDHandlers(BaseHandler):
 
     def __init__(self) -> None:
         super().__init__(domain="osd")
+        # Built once per handler; _handle_operation used to rebuild
+        # this dict (and its bound methods) on every request
+        self.register_ops(
+            {
+                "get_osd_summary": self.get_osd_summary,
+                "get_osd_id": self.get_osd_id,
+                "get_osd_details": self.get_osd_details,
+                "perform_osd_mark_action": self.perform_osd_mark_action,
+            }
+        )
 
     async def _handle_operation(
         self, operation: str, params: dict[str, Any]
     ) -> MCPResponse:
         """Route OSD operations to appropriate methods."""
-        operation_map = {
-            "get_osd_summary": self.get_osd_summary,
-            "get_osd_id": self.get_osd_id,
-            "get_osd_details": self.get_osd_details,
-            "perform_osd_mark_action": self.perform_osd_mark_action,
-        }
-
-        if operation not in operation_map:
+        handler = self._ops.get(operation)
+        if handler is None:
             return self.create_error_response(
                 message=f"Unknown OSD operation: {operation}",
                 error_code="UNKNOWN_OPERATION",
             )
 
-        return await operation_map[operation](params)
+        return await handler(params)
 
     async def get_osd_summary(self, params: dict[str, Any]) -> MCPResponse:
         """
@@ -57,6 +66,10 @@ class OSDHandlers(BaseHandler):
         # Get OSD summary data
         osd_summary = await client.osd.get_osd_summary()
 
+        # One clock read covers the payload stamp and the MCPResponse
+        # timestamp below
+        stamped_at, timestamp = now_stamp()
+
         # Format response data
         summary_data = {
             "cluster_summary": {
@@ -89,7 +102,7 @@ class OSDHandlers(BaseHandler):
                     for device_class, summary in osd_summary.device_class_summary.items()
                 },
             },
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
         }
 
         # Generate appropriate message
@@ -98,7 +111,9 @@ class OSDHandlers(BaseHandler):
         else:
             message = f"Cluster has {osd_summary.total_osds} OSDs: {osd_summary.up_osds} up, {osd_summary.down_osds} down"
 
-        return self.create_success_response(data=summary_data, message=message)
+        return self.create_success_response(
+            data=summary_data, message=message, timestamp=stamped_at
+        )
 
     async def get_osd_id(self, params: dict[str, Any]) -> MCPResponse:
         """
@@ -115,23 +130,28 @@ class OSDHandlers(BaseHandler):
         # Get OSD ID information
         osd_id_info = await client.osd.get_osd_ids()
 
+        stamped_at, timestamp = now_stamp()
+
+        # One scan over the mappings; the count feeds both the summary
+        # and the message
+        host_count = len({mapping["hostname"] for mapping in osd_id_info.osd_ids})
+
         # Format response data
         id_data = {
             "osd_mappings": osd_id_info.osd_ids,
             "summary": {
                 "total_osds": osd_id_info.total_count,
-                "unique_hosts": len(
-                    {mapping["hostname"] for mapping in osd_id_info.osd_ids}
-                ),
+                "unique_hosts": host_count,
             },
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
         }
 
         # Generate descriptive message
-        host_count = len({mapping["hostname"] for mapping in osd_id_info.osd_ids})
         message = f"Found {osd_id_info.total_count} OSDs distributed across {host_count} hosts"
 
-        return self.create_success_response(data=id_data, message=message)
+        return self.create_success_response(
+            data=id_data, message=message, timestamp=stamped_at
+        )
 
     async def get_osd_details(self, params: dict[str, Any]) -> MCPResponse:
         """
@@ -159,11 +179,20 @@ class OSDHandlers(BaseHandler):
         # Get detailed OSD information
         osd = await client.osd.get_osd_details(osd_id)
 
+        stamped_at, timestamp = now_stamp()
+
+        # Resolve values needed in both the payload and the message once
+        hostname = osd.get_hostname()
+        status_display = osd.get_status_display()
+        used_gb = osd.get_used_gb()
+        capacity_gb = osd.get_capacity_gb()
+        usage_percentage = osd.get_usage_percentage()
+
         # Format detailed response
         osd_details = {
             "basic_info": {
                 "osd_id": osd.osd,
-                "hostname": osd.get_hostname(),
+                "hostname": hostname,
                 "device_class": osd.get_device_class(),
                 "weight": osd.weight,
                 "operational_status": osd.operational_status,
@@ -174,16 +203,16 @@ class OSDHandlers(BaseHandler):
                 "in": osd.is_in(),
                 "out": osd.is_out(),
                 "working": osd.is_working(),
-                "status_display": osd.get_status_display(),
+                "status_display": status_display,
             },
             "capacity": {
                 "total_kb": osd.osd_stats.kb,
                 "used_kb": osd.osd_stats.kb_used,
                 "available_kb": osd.osd_stats.kb_avail,
-                "total_gb": osd.get_capacity_gb(),
-                "used_gb": osd.get_used_gb(),
+                "total_gb": capacity_gb,
+                "used_gb": used_gb,
                 "available_gb": osd.get_available_gb(),
-                "usage_percentage": osd.get_usage_percentage(),
+                "usage_percentage": usage_percentage,
             },
             "performance": {
                 "commit_latency_ms": osd.osd_stats.perf_stat.commit_latency_ms,
@@ -193,13 +222,15 @@ class OSDHandlers(BaseHandler):
             "statistics": {
                 "alerts_count": len(osd.osd_stats.alerts),
             },
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
         }
 
         # Generate descriptive message
-        message = f"OSD {osd_id} on '{osd.get_hostname()}' is {osd.get_status_display()} with {osd.get_usage_percentage()}% usage ({osd.get_used_gb()}GB/{osd.get_capacity_gb()}GB)"
+        message = f"OSD {osd_id} on '{hostname}' is {status_display} with {usage_percentage}% usage ({used_gb}GB/{capacity_gb}GB)"
 
-        return self.create_success_response(data=osd_details, message=message)
+        return self.create_success_response(
+            data=osd_details, message=message, timestamp=stamped_at
+        )
 
     async def perform_osd_mark_action(self, params: dict[str, Any]) -> MCPResponse:
         """
@@ -223,10 +254,9 @@ class OSDHandlers(BaseHandler):
             )
 
         # Validate action
-        valid_actions = ["noout", "out", "in"]
-        if action not in valid_actions:
+        if action not in _VALID_MARK_ACTIONS:
             return self.create_error_response(
-                message=f"Invalid action '{action}'. Valid actions: {', '.join(valid_actions)}",
+                message=f"Invalid action '{action}'. Valid actions: {_VALID_MARK_ACTIONS_STR}",
                 error_code="VALIDATION_ERROR",
             )
 
@@ -236,6 +266,8 @@ class OSDHandlers(BaseHandler):
         # Perform OSD mark action
         action_result = await client.osd.perform_osd_mark_action(osd_id, action)
 
+        stamped_at, timestamp = now_stamp()
+
         # Format response data
         action_data = {
             "osd_info": {
@@ -244,7 +276,7 @@ class OSDHandlers(BaseHandler):
                 "success": action_result["success"],
             },
             "api_response": action_result.get("response", {}),
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
         }
 
         # Generate descriptive message
@@ -255,4 +287,6 @@ class OSDHandlers(BaseHandler):
         }
         message = f"Successfully {action_description.get(action, action)} OSD {osd_id}"
 
-        return self.create_success_response(data=action_data, message=message)
+        return self.create_success_response(
+            data=action_data, message=message, timestamp=stamped_at
+        )
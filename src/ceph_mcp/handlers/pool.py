@@ -4,10 +4,9 @@ Pool Domain Handlers
 This module contains all MCP request handlers related to cluster pools.
 """
 
-from datetime import datetime
 from typing import Any
 
-from ceph_mcp.handlers.base import BaseHandler
+from ceph_mcp.handlers.base import BaseHandler, now_stamp
 from ceph_mcp.models.base import MCPResponse
 
 
@@ -21,23 +20,27 @@ class PoolHandlers(BaseHandler):
 
     def __init__(self) -> None:
         super().__init__(domain="pool")
+        # Built once per handler; _handle_operation used to rebuild
+        # this dict (and its bound methods) on every request
+        self.register_ops(
+            {
+                "get_pool_summary": self.get_pool_summary,
+                "get_pool_details": self.get_pool_details,
+            }
+        )
 
     async def _handle_operation(
         self, operation: str, params: dict[str, Any]
     ) -> MCPResponse:
         """Route pool operations to appropriate methods."""
-        operation_map = {
-            "get_pool_summary": self.get_pool_summary,
-            "get_pool_details": self.get_pool_details,
-        }
-
-        if operation not in operation_map:
+        handler = self._ops.get(operation)
+        if handler is None:
             return self.create_error_response(
                 message=f"Unknown pool operation: {operation}",
                 error_code="UNKNOWN_OPERATION",
             )
 
-        return await operation_map[operation](params)
+        return await handler(params)
 
     async def get_pool_summary(self, params: dict[str, Any]) -> MCPResponse:
         """
@@ -55,15 +58,26 @@ class PoolHandlers(BaseHandler):
         # Get pool summary data
         pool_summary = await client.pool.get_pool_summary()
 
+        # One clock read covers the payload stamp and the MCPResponse
+        # timestamp below
+        stamped_at, timestamp = now_stamp()
+
+        # Bind the tallies once; they feed both the response data and
+        # the message below
+        total_pools = pool_summary.total_pools
+        healthy_pools = pool_summary.healthy_pools
+        unhealthy_pools = pool_summary.unhealthy_pools
+        total_pgs = pool_summary.total_pgs
+
         # Format response data
         summary_data = {
             "cluster_summary": {
-                "total_pools": pool_summary.total_pools,
+                "total_pools": total_pools,
                 "replicated_pools": pool_summary.replicated_pools,
                 "erasure_pools": pool_summary.erasure_pools,
-                "healthy_pools": pool_summary.healthy_pools,
-                "unhealthy_pools": pool_summary.unhealthy_pools,
-                "total_pgs": pool_summary.total_pgs,
+                "healthy_pools": healthy_pools,
+                "unhealthy_pools": unhealthy_pools,
+                "total_pgs": total_pgs,
             },
             "pool_types": {
                 pool_type: {
@@ -82,16 +96,18 @@ class PoolHandlers(BaseHandler):
             "pool_names": pool_summary.get_pool_names(),
             "unique_applications": pool_summary.get_unique_applications(),
             "average_pool_size": pool_summary.get_average_pool_size(),
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
         }
 
         # Generate appropriate message
-        if pool_summary.unhealthy_pools == 0:
-            message = f"All {pool_summary.total_pools} pools are healthy with {pool_summary.total_pgs} total PGs"
+        if unhealthy_pools == 0:
+            message = f"All {total_pools} pools are healthy with {total_pgs} total PGs"
         else:
-            message = f"Cluster has {pool_summary.total_pools} pools: {pool_summary.healthy_pools} healthy, {pool_summary.unhealthy_pools} with PG issues"
+            message = f"Cluster has {total_pools} pools: {healthy_pools} healthy, {unhealthy_pools} with PG issues"
 
-        return self.create_success_response(data=summary_data, message=message)
+        return self.create_success_response(
+            data=summary_data, message=message, timestamp=stamped_at
+        )
 
     async def get_pool_details(self, params: dict[str, Any]) -> MCPResponse:
         """
@@ -110,6 +126,8 @@ class PoolHandlers(BaseHandler):
         # Get detailed pool information
         pool = await client.pool.get_pool_details(pool_name)
 
+        stamped_at, timestamp = now_stamp()
+
         # Format detailed response
         pool_details = {
             "basic_info": {
@@ -145,11 +163,13 @@ class PoolHandlers(BaseHandler):
                 "primary_applications": pool.get_primary_applications(),
                 "application_count": len(pool.application_metadata),
             },
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
         }
 
         # Generate descriptive message
         health_status = "healthy" if pool.is_healthy() else "has PG issues"
         message = f"Pool '{pool_name}' is {pool.type} type with {pool.get_replica_info()} replicas, {pool.get_total_pgs()} PGs and {health_status}"
 
-        return self.create_success_response(data=pool_details, message=message)
+        return self.create_success_response(
+            data=pool_details, message=message, timestamp=stamped_at
+        )
@@ -10,6 +10,10 @@ from typing import Any
 
 from pydantic import BaseModel, Field
 
+# Statuses treated as healthy; frozen at module scope so is_healthy does
+# a hashed membership test with no per-call list allocation
+_HEALTHY_STATUSES = frozenset({"up", "online", "active", "ok"})
+
 
 class BaseComponentInfo(BaseModel):
     """
@@ -26,8 +30,10 @@ class BaseComponentInfo(BaseModel):
 
     def is_healthy(self) -> bool:
         """Check if this component is in a healthy state."""
-        healthy_statuses = ["up", "online", "active", "ok"]
-        return str(self.status).lower() in healthy_statuses
+        status = self.status
+        if not isinstance(status, str):
+            status = str(status)
+        return status.lower() in _HEALTHY_STATUSES
 
     def get_status_summary(self) -> str:
         """Get a human-readable summary of this component's status."""
@@ -53,14 +59,19 @@ class MCPResponse(BaseModel):
 
     @classmethod
     def success_response(
-        cls, data: Any, message: str = "Operation completed successfully"
+        cls,
+        data: Any,
+        message: str = "Operation completed successfully",
+        **kwargs: Any,
     ) -> "MCPResponse":
         """Create a successful response."""
-        return cls(success=True, data=data, message=message, error_code=None)
+        return cls(success=True, data=data, message=message, error_code=None, **kwargs)
 
     @classmethod
     def error_response(
-        cls, message: str, error_code: str | None = None
+        cls, message: str, error_code: str | None = None, **kwargs: Any
     ) -> "MCPResponse":
         """Create an error response."""
-        return cls(success=False, data=None, message=message, error_code=error_code)
+        return cls(
+            success=False, data=None, message=message, error_code=error_code, **kwargs
+        )
@@ -7,20 +7,23 @@ This module contains all data models related to Ceph Filesystems.
 from datetime import datetime
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+
+# Bytes-to-GiB as one multiplication instead of a division per call
+_INV_GIB = 1.0 / (1024**3)
 
 
 class MDSMap(BaseModel):
     """MDS map information for a filesystem."""
 
-    fs_name: str = Field(..., description="Filesystem name")
+    fs_name: str = Field(default="unknown", description="Filesystem name")
 
 
 class CephFS(BaseModel):
     """Represents a Ceph Filesystem with all its attributes."""
 
-    id: int = Field(..., description="Filesystem ID")
-    mdsmap: MDSMap = Field(..., description="MDS map information")
+    id: int = Field(default=0, description="Filesystem ID")
+    mdsmap: MDSMap = Field(default_factory=MDSMap, description="MDS map information")
 
     def get_fs_name(self) -> str:
         """Get filesystem name."""
@@ -46,31 +49,46 @@ class CephFSSummary(BaseModel):
         default_factory=datetime.now, description="Data collection timestamp"
     )
 
+    # Lazily built id/name indices so repeated lookups against the same
+    # summary are O(1) instead of rescanning the filesystems list
+    _by_id: dict[int, CephFS] | None = PrivateAttr(default=None)
+    _by_name: dict[str, CephFS] | None = PrivateAttr(default=None)
+    _name_id_mapping: dict[str, int] | None = PrivateAttr(default=None)
+
     def get_filesystem_by_id(self, fs_id: int) -> CephFS | None:
         """Find a filesystem by its ID."""
-        for fs in self.filesystems:
-            if fs.get_fs_id() == fs_id:
-                return fs
-        return None
+        index = self._by_id
+        if index is None:
+            index = self._by_id = {fs.get_fs_id(): fs for fs in self.filesystems}
+        return index.get(fs_id)
 
     def get_filesystem_by_name(self, fs_name: str) -> CephFS | None:
         """Find a filesystem by its name."""
-        for fs in self.filesystems:
-            if fs.get_fs_name() == fs_name:
-                return fs
-        return None
+        index = self._by_name
+        if index is None:
+            index = self._by_name = {
+                fs.get_fs_name(): fs for fs in self.filesystems
+            }
+        return index.get(fs_name)
 
     def get_filesystem_names(self) -> list[str]:
         """Get list of all filesystem names."""
-        return [fs.get_fs_name() for fs in self.filesystems]
+        # The parser populates this field from the same filesystems list;
+        # no need to regenerate it per call
+        return self.filesystem_names
 
     def get_filesystem_ids(self) -> list[int]:
         """Get list of all filesystem IDs."""
-        return [fs.get_fs_id() for fs in self.filesystems]
+        return self.filesystem_ids
 
     def get_name_id_mapping(self) -> dict[str, int]:
         """Get mapping of filesystem names to IDs."""
-        return {fs.get_fs_name(): fs.get_fs_id() for fs in self.filesystems}
+        mapping = self._name_id_mapping
+        if mapping is None:
+            mapping = self._name_id_mapping = {
+                fs.get_fs_name(): fs.get_fs_id() for fs in self.filesystems
+            }
+        return mapping
 
     def get_summary_text(self) -> str:
         """Get a human-readable summary."""
@@ -87,26 +105,26 @@ class CephFSSummary(BaseModel):
 class CephFSRank(BaseModel):
     """MDS rank information."""
 
-    rank: int
-    state: str
-    mds: str
+    rank: int = 0
+    state: str = "unknown"
+    mds: str = "unknown"
 
 
 class CephFSPool(BaseModel):
     """Pool information."""
 
-    pool: str
-    type: str
-    used: int  # bytes
-    avail: int  # bytes
+    pool: str = "unknown"
+    type: str = "unknown"
+    used: int = 0  # bytes
+    avail: int = 0  # bytes
 
     def get_used_gb(self) -> float:
         """Get used space in GB."""
-        return self.used / (1024**3)
+        return self.used * _INV_GIB
 
     def get_total_gb(self) -> float:
         """Get total space in GB."""
-        return (self.used + self.avail) / (1024**3)
+        return (self.used + self.avail) * _INV_GIB
 
     def get_used_percent(self) -> float:
         """Get usage percentage."""
@@ -117,17 +135,37 @@ class CephFSPool(BaseModel):
 class CephFSDetails(BaseModel):
     """Detailed CephFS filesystem information."""
 
-    id: int
-    name: str
-    client_count: int
-    ranks: list[CephFSRank]
-    pools: list[CephFSPool]
+    id: int = 0
+    name: str = "unknown"
+    client_count: int = 0
+    ranks: list[CephFSRank] = Field(default_factory=list)
+    pools: list[CephFSPool] = Field(default_factory=list)
     collected_at: datetime = Field(default_factory=datetime.now)
 
+    # Lazily classified (metadata, data) pools; details renders need
+    # both, so one pass over the pools list covers both accessors
+    _classified_pools: tuple[CephFSPool | None, CephFSPool | None] | None = (
+        PrivateAttr(default=None)
+    )
+
+    def _classify_pools(self) -> tuple[CephFSPool | None, CephFSPool | None]:
+        """Find the first metadata and data pools in one pass."""
+        classified = self._classified_pools
+        if classified is None:
+            metadata_pool = data_pool = None
+            for pool in self.pools:
+                if pool.type == "metadata":
+                    if metadata_pool is None:
+                        metadata_pool = pool
+                elif pool.type == "data" and data_pool is None:
+                    data_pool = pool
+            classified = self._classified_pools = (metadata_pool, data_pool)
+        return classified
+
     def get_metadata_pool(self) -> CephFSPool | None:
         """Get metadata pool."""
-        return next((p for p in self.pools if p.type == "metadata"), None)
+        return self._classify_pools()[0]
 
     def get_data_pool(self) -> CephFSPool | None:
         """Get data pool."""
-        return next((p for p in self.pools if p.type == "data"), None)
+        return self._classify_pools()[1]
@@ -0,0 +1,48 @@
+"""
+Cluster Domain Models
+
+This module contains composite models that aggregate information
+from multiple Ceph domains into a single cluster-wide view.
+"""
+
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+from ceph_mcp.models.cephfs import CephFSSummary
+from ceph_mcp.models.daemon import DaemonSummary
+from ceph_mcp.models.health import ClusterHealth
+from ceph_mcp.models.host import HostSummary
+from ceph_mcp.models.osd import OSDSummary
+from ceph_mcp.models.pool import PoolSummary
+
+
+class ClusterOverview(BaseModel):
+    """
+    Aggregated overview of the entire Ceph cluster.
+
+    Each component is optional so a failure in one domain (recorded in
+    `errors`) does not prevent the rest of the overview from being returned.
+    """
+
+    health: ClusterHealth | None = Field(None, description="Cluster health status")
+    hosts: HostSummary | None = Field(None, description="Host summary")
+    daemons: DaemonSummary | None = Field(None, description="Daemon summary")
+    osds: OSDSummary | None = Field(None, description="OSD summary")
+    pools: PoolSummary | None = Field(None, description="Pool summary")
+    filesystems: CephFSSummary | None = Field(None, description="CephFS summary")
+    errors: dict[str, str] = Field(
+        default_factory=dict,
+        description="Per-component error messages for failed fetches",
+    )
+    collected_at: datetime = Field(
+        default_factory=datetime.now, description="Data collection timestamp"
+    )
+
+    def is_complete(self) -> bool:
+        """Check whether all components were fetched successfully."""
+        return not self.errors
+
+    def get_failed_components(self) -> list[str]:
+        """Get the names of components that failed to fetch."""
+        return list(self.errors.keys())
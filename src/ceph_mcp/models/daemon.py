@@ -6,7 +6,10 @@ This module contains all data models related to Ceph daemons.
 
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+
+# Bytes-to-GiB as one multiplication instead of three divisions per call
+_INV_GIB = 1.0 / (1024**3)
 
 
 class Daemon(BaseModel):
@@ -43,11 +46,11 @@ class Daemon(BaseModel):
 
     def get_memory_usage_gb(self) -> float:
         """Get memory usage in GB."""
-        return round(self.memory_usage / 1024 / 1024 / 1024, 2)
+        return round(self.memory_usage * _INV_GIB, 2)
 
     def get_memory_request_gb(self) -> float:
         """Get memory request in GB."""
-        return round(self.memory_request / 1024 / 1024 / 1024, 2)
+        return round(self.memory_request * _INV_GIB, 2)
 
     def get_cpu_percentage_float(self) -> float:
         """Get CPU percentage as float."""
@@ -88,37 +91,71 @@ class DaemonSummary(BaseModel):
         default_factory=datetime.now, description="Data collection timestamp"
     )
 
+    # Lazily built lookup indices so repeated queries against the same
+    # summary are O(1)/O(K) instead of rescanning the daemons list and
+    # re-evaluating is_running() per element
+    _by_name: dict[str, Daemon] | None = PrivateAttr(default=None)
+    _by_name_and_host: dict[tuple[str, str], Daemon] | None = PrivateAttr(
+        default=None
+    )
+    _by_type: dict[str, list[Daemon]] | None = PrivateAttr(default=None)
+    _running_partition: tuple[list[Daemon], list[Daemon]] | None = PrivateAttr(
+        default=None
+    )
+
     def get_daemon_by_name(self, daemon_name: str) -> Daemon | None:
         """Find a daemon by its name."""
-        for daemon in self.daemons:
-            if daemon.daemon_name == daemon_name:
-                return daemon
-        return None
+        index = self._by_name
+        if index is None:
+            index = self._by_name = {
+                daemon.daemon_name: daemon for daemon in self.daemons
+            }
+        return index.get(daemon_name)
 
     def get_daemon_by_name_and_host(
         self, daemon_name: str, hostname: str
     ) -> Daemon | None:
         """Find a daemon by name and hostname."""
-        for daemon in self.daemons:
-            if daemon.daemon_name == daemon_name and daemon.hostname == hostname:
-                return daemon
-        return None
+        index = self._by_name_and_host
+        if index is None:
+            index = self._by_name_and_host = {
+                (daemon.daemon_name, daemon.hostname): daemon
+                for daemon in self.daemons
+            }
+        return index.get((daemon_name, hostname))
 
     def get_daemons_by_type(self, daemon_type: str) -> list[Daemon]:
         """Get all daemons of a specific type."""
-        return [daemon for daemon in self.daemons if daemon.daemon_type == daemon_type]
+        index = self._by_type
+        if index is None:
+            index = {}
+            for daemon in self.daemons:
+                index.setdefault(daemon.daemon_type, []).append(daemon)
+            self._by_type = index
+        return index.get(daemon_type, [])
+
+    def _partition_by_running(self) -> tuple[list[Daemon], list[Daemon]]:
+        """Split the daemons into (running, stopped) lists in one pass."""
+        partition = self._running_partition
+        if partition is None:
+            running: list[Daemon] = []
+            stopped: list[Daemon] = []
+            for daemon in self.daemons:
+                (running if daemon.is_running() else stopped).append(daemon)
+            partition = self._running_partition = (running, stopped)
+        return partition
 
     def get_running_daemons(self) -> list[Daemon]:
         """Get list of running daemons."""
-        return [daemon for daemon in self.daemons if daemon.is_running()]
+        return self._partition_by_running()[0]
 
     def get_stopped_daemons(self) -> list[Daemon]:
         """Get list of stopped daemons."""
-        return [daemon for daemon in self.daemons if daemon.is_stopped()]
+        return self._partition_by_running()[1]
 
     def get_daemon_types(self) -> list[str]:
         """Get list of unique daemon types."""
-        return list(dict(self.daemon_types).keys()) if self.daemon_types else []
+        return list(self.daemon_types)
 
 
 class DaemonTypeInfo(BaseModel):
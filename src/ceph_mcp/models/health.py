@@ -122,6 +122,23 @@ class ClusterHealth(BaseComponentInfo):
         """Get all warning health checks."""
         return [check for check in self.checks if check.is_warning()]
 
+    def partition_checks(self) -> tuple[list[HealthCheck], list[HealthCheck]]:
+        """
+        Split the checks into (critical, warning) lists in one pass.
+
+        Callers that need both groups should prefer this over calling
+        get_critical_checks() and get_warning_checks() back to back,
+        which walks the checks list twice.
+        """
+        critical: list[HealthCheck] = []
+        warning: list[HealthCheck] = []
+        for check in self.checks:
+            if check.is_critical():
+                critical.append(check)
+            elif check.is_warning():
+                warning.append(check)
+        return critical, warning
+
     def get_checks_by_priority(self) -> list[HealthCheck]:
         """Get health checks sorted by priority (most urgent first)."""
         return sorted(self.checks, key=lambda x: x.get_priority_score(), reverse=True)
@@ -154,8 +171,7 @@ class ClusterHealth(BaseComponentInfo):
             recommendations.append("Cluster is healthy - continue regular monitoring")
             return recommendations
 
-        critical_checks = self.get_critical_checks()
-        warning_checks = self.get_warning_checks()
+        critical_checks, warning_checks = self.partition_checks()
 
         if critical_checks:
             recommendations.append(
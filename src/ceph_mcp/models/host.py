@@ -7,7 +7,7 @@ This module contains all data models related to Ceph hosts.
 from datetime import datetime
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class ServiceInstance(BaseModel):
@@ -102,12 +102,21 @@ class HostSummary(BaseModel):
         default_factory=datetime.now, description="Data collection timestamp"
     )
 
+    # Lazily built name -> Host index (hostname, shortname and fqdn all
+    # resolve) so repeated lookups are O(1)
+    _by_name: dict[str, Host] | None = PrivateAttr(default=None)
+
     def get_host_by_hostname(self, hostname: str) -> Host | None:
         """Find a host by hostname."""
-        for host in self.hosts:
-            if hostname in (host.hostname, host.shortname, host.fqdn):
-                return host
-        return None
+        index = self._by_name
+        if index is None:
+            index = self._by_name = {}
+            for host in self.hosts:
+                # setdefault keeps the first match, like the old linear scan
+                index.setdefault(host.hostname, host)
+                index.setdefault(host.shortname, host)
+                index.setdefault(host.fqdn, host)
+        return index.get(hostname)
 
     def get_online_hosts(self) -> list[Host]:
         """Get list of online hosts."""
@@ -7,7 +7,10 @@ This module contains all data models related to Ceph OSDs.
 from datetime import datetime
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+
+# KB-to-GB as one multiplication instead of two divisions per call
+_KB_TO_GB = 1.0 / (1024 * 1024)
 
 
 class PerfStat(BaseModel):
@@ -97,15 +100,15 @@ class OSD(BaseModel):
 
     def get_capacity_gb(self) -> float:
         """Get total capacity in GB."""
-        return round(int(self.osd_stats.kb) / 1024 / 1024, 2)
+        return round(int(self.osd_stats.kb) * _KB_TO_GB, 2)
 
     def get_used_gb(self) -> float:
         """Get used capacity in GB."""
-        return round(int(self.osd_stats.kb_used) / 1024 / 1024, 2)
+        return round(int(self.osd_stats.kb_used) * _KB_TO_GB, 2)
 
     def get_available_gb(self) -> float:
         """Get available capacity in GB."""
-        return round(int(self.osd_stats.kb_avail) / 1024 / 1024, 2)
+        return round(int(self.osd_stats.kb_avail) * _KB_TO_GB, 2)
 
     def get_usage_percentage(self) -> float:
         """Get usage percentage."""
@@ -134,15 +137,15 @@ class DeviceClassSummary(BaseModel):
 
     def get_total_capacity_gb(self) -> float:
         """Get total capacity in GB."""
-        return round(self.total_capacity_kb / 1024 / 1024, 2)
+        return round(self.total_capacity_kb * _KB_TO_GB, 2)
 
     def get_total_used_gb(self) -> float:
         """Get total used capacity in GB."""
-        return round(self.total_used_kb / 1024 / 1024, 2)
+        return round(self.total_used_kb * _KB_TO_GB, 2)
 
     def get_total_available_gb(self) -> float:
         """Get total available capacity in GB."""
-        return round(self.total_available_kb / 1024 / 1024, 2)
+        return round(self.total_available_kb * _KB_TO_GB, 2)
 
 
 class OSDSummary(BaseModel):
@@ -166,12 +169,15 @@ class OSDSummary(BaseModel):
         default_factory=datetime.now, description="Data collection timestamp"
     )
 
+    # Lazily built id -> OSD index so repeated lookups are O(1)
+    _by_id: dict[int, OSD] | None = PrivateAttr(default=None)
+
     def get_osd_by_id(self, osd_id: int) -> OSD | None:
         """Find an OSD by its ID."""
-        for osd in self.osds:
-            if osd.osd == osd_id:
-                return osd
-        return None
+        index = self._by_id
+        if index is None:
+            index = self._by_id = {osd.osd: osd for osd in self.osds}
+        return index.get(osd_id)
 
     def get_osds_by_host(self, hostname: str) -> list[OSD]:
         """Get all OSDs on a specific host."""
@@ -6,7 +6,7 @@ This module contains all data models related to Ceph pools.
 
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class PoolOptions(BaseModel):
@@ -143,12 +143,18 @@ class PoolSummary(BaseModel):
         default_factory=datetime.now, description="Data collection timestamp"
     )
 
+    # Lazily built name -> Pool index so repeated lookups are O(1)
+    _by_name: dict[str, Pool] | None = PrivateAttr(default=None)
+
+    def _name_index(self) -> dict[str, Pool]:
+        index = self._by_name
+        if index is None:
+            index = self._by_name = {pool.pool_name: pool for pool in self.pools}
+        return index
+
     def get_pool_by_name(self, pool_name: str) -> Pool | None:
         """Find a pool by its name."""
-        for pool in self.pools:
-            if pool.pool_name == pool_name:
-                return pool
-        return None
+        return self._name_index().get(pool_name)
 
     def get_pools_by_type(self, pool_type: str) -> list[Pool]:
         """Get all pools of a specific type."""
@@ -164,7 +170,7 @@ class PoolSummary(BaseModel):
 
     def get_pool_names(self) -> list[str]:
         """Get list of all pool names."""
-        return [pool.pool_name for pool in self.pools]
+        return list(self._name_index())
 
     def get_unique_applications(self) -> list[str]:
         """Get list of unique applications across all pools."""
@@ -8,9 +8,11 @@ import logging
 import structlog
 from fastmcp import FastMCP
 
+from ceph_mcp.api.base import aclose_shared_httpx_client
 from ceph_mcp.api.client import CephClient
 from ceph_mcp.config.settings import settings
 from ceph_mcp.handlers.cephfs import CephFSHandlers
+from ceph_mcp.handlers.cluster import ClusterHandlers
 from ceph_mcp.handlers.daemon import DaemonHandlers
 from ceph_mcp.handlers.health import HealthHandlers
 from ceph_mcp.handlers.host import HostHandlers
@@ -18,6 +20,7 @@ from ceph_mcp.handlers.osd import OSDHandlers
 from ceph_mcp.handlers.pool import PoolHandlers
 from ceph_mcp.resources.health import HealthResources
 from ceph_mcp.tools.cephfs import CephFSTools
+from ceph_mcp.tools.cluster import ClusterTools
 from ceph_mcp.tools.daemon import DaemonTools
 from ceph_mcp.tools.health import HealthTools
 from ceph_mcp.tools.host import HostTools
@@ -43,6 +46,7 @@ async def cleanup_global_client() -> None:
     if _global_ceph_client:
         await _global_ceph_client.__aexit__(None, None, None)
         _global_ceph_client = None
+    await aclose_shared_httpx_client()
 
 
 def configure_logging() -> None:
@@ -103,6 +107,7 @@ class CephMCPServer:  # pylint: disable=too-few-public-methods
         self.osd_handlers = OSDHandlers()
         self.pool_handlers = PoolHandlers()
         self.cephfs_handler = CephFSHandlers()
+        self.cluster_handlers = ClusterHandlers()
 
         # Initialize resources (auto-registers with FastMCP)
         self.health_resources = HealthResources(self.mcp, self.health_handlers)
@@ -114,6 +119,7 @@ class CephMCPServer:  # pylint: disable=too-few-public-methods
         self.osd_tools = OSDTools(self.mcp, self.osd_handlers)
         self.pool_tools = PoolTools(self.mcp, self.pool_handlers)
         self.cephfs_tools = CephFSTools(self.mcp, self.cephfs_handler)
+        self.cluster_tools = ClusterTools(self.mcp, self.cluster_handlers)
 
         self.logger.info(
             "Ceph MCP Server initialized with FastMCP architecture",
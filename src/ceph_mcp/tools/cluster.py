@@ -0,0 +1,50 @@
+"""Module for cluster-wide tools in Ceph MCP."""
+
+from ceph_mcp.handlers.cluster import ClusterHandlers
+from ceph_mcp.models.base import MCPResponse
+from ceph_mcp.tools.base import ToolModule
+
+
+class ClusterTools(ToolModule):
+    """Cluster-wide composite tools for Ceph cluster."""
+
+    def __init__(self, mcp, cluster_handlers: ClusterHandlers):
+        self.cluster_handlers = cluster_handlers
+        super().__init__(mcp, "cluster")
+
+    def register_tools(self) -> None:
+        """Register cluster tools."""
+
+        @self.mcp.tool(
+            name="get_cluster_overview",
+            description="Get an aggregated overview of health, hosts, daemons, OSDs, pools and filesystems in a single call",
+        )
+        async def get_cluster_overview() -> str:
+            """Get an aggregated overview of the entire Ceph cluster."""
+            response = await self.cluster_handlers.handle_request(
+                "get_cluster_overview", {}
+            )
+            return self.format_response(response)
+
+    def format_response(self, response: MCPResponse) -> str:
+        """Format response for cluster tools as multi-line formatted text."""
+        lines = []
+        lines.append(
+            f"Operation status: {'success' if response.success else 'failure'}"
+        )
+        if not response.success and getattr(response, "error_code", None):
+            lines.append(f"Error code: {response.error_code}")
+        if response.message:
+            lines.append(f"Message: {response.message}")
+        if response.data:
+            lines.append("Data:")
+            if isinstance(response.data, dict):
+                for k, v in response.data.items():
+                    lines.append(f"  {k}: {v}")
+            else:
+                lines.append(f"  {response.data}")
+        if response.timestamp:
+            lines.append(f"Collected at: {response.timestamp.isoformat()}")
+
+        formatted_text = "\n".join(lines)
+        return formatted_text
@@ -38,9 +38,20 @@ class DaemonTools(ToolModule):
         @self.mcp.tool(
             name="get_daemon_details", description="Get detailed daemon information"
         )
-        async def get_daemon_details(hostname: str, daemon_name: str) -> str:
-            """Get detailed facts and information about a specific daemon."""
-            arguments = {"hostname": hostname, "daemon_name": daemon_name}
+        async def get_daemon_details(
+            hostname: str,
+            daemon_name: str,
+            fields: list[str] | None = None,
+        ) -> str:
+            """
+            Get detailed facts and information about a specific daemon.
+
+            fields optionally limits the response to the named sections
+            ("basic_info", "version_info", "resource_usage").
+            """
+            arguments: dict = {"hostname": hostname, "daemon_name": daemon_name}
+            if fields:
+                arguments["fields"] = fields
 
             response = await self.daemon_handlers.handle_request(
                 "get_daemon_details", arguments
@@ -28,9 +28,18 @@ class HostTools(ToolModule):
         @self.mcp.tool(
             name="get_host_details", description="Get detailed host information"
         )
-        async def get_host_details(hostname: str) -> str:
-            """Get detailed facts and information about a specific host."""
-            arguments = {"hostname": hostname}
+        async def get_host_details(
+            hostname: str, fields: list[str] | None = None
+        ) -> str:
+            """
+            Get detailed facts and information about a specific host.
+
+            fields optionally limits the response to the named sections
+            ("basic_info", "services", "hardware", "memory", "system").
+            """
+            arguments: dict = {"hostname": hostname}
+            if fields:
+                arguments["fields"] = fields
 
             response = await self.host_handlers.handle_request(
                 "get_host_details", arguments